@@ -1,15 +1,37 @@
+import queue
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tkinter import ttk
 from csv_repo import Student_Repository
 from tkinter import messagebox
 
+# parse an already stripped score field, empty or invalid -> None
+def _as_float(s: str):
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
 class Main_Page:
     def __init__(self, root=None):  
         self.root = root
         self.root.title("system homepage")
         self.root.geometry("600x400")
+        # single worker thread for file I/O, keeps writes in order and off the Tk main thread
+        self.io_pool = ThreadPoolExecutor(max_workers=1)
+        # callbacks from the worker thread, run on the Tk main thread by _poll_main
+        self._main_calls = queue.Queue()
+        self._poll_job = None
+        # student repository shared by all pages, loaded on first use
+        self._repo = None
         self.create_page()
         self.create_menu()
+        # save pending changes before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self._poll_main()
 
     def create_page(self):
         # 1. set a container frame to contain all pages
@@ -18,12 +40,14 @@ class Main_Page:
         self.container_frame.grid_rowconfigure(0, weight=1)
         self.container_frame.grid_columnconfigure(0, weight=1)
 
-        # 2. create and cache all pages
+        # 2. register pages, each one is created on first show
+        self._page_classes = {
+            Page.__name__: Page
+            for Page in (home_page, Enroll_Page, Query_Page, Delete_Page, Update_Page)
+        }
         self.pages = {}
-        for Page in (home_page, Enroll_Page, Query_Page, Delete_Page, Update_Page):
-            page = Page(self.container_frame, self)
-            self.pages[Page.__name__] = page
-            page.grid(row=0, column=0, sticky="nsew")
+        # page name -> bound tkraise of the created page
+        self._raisers = {}
 
         # set default page
         self.showframe("home_page")
@@ -35,23 +59,24 @@ class Main_Page:
         # add file menu
         file_menu = tk.Menu(menu_bar, tearoff=0)
         file_menu.add_command(label="Enroll",
-                              command=lambda: self.showframe("Enroll_Page"))
+                              command=partial(self.showframe, "Enroll_Page"))
+        file_menu.add_command(label="Save", command=self.save)
         menu_bar.add_cascade(label="File", menu=file_menu)
 
         # add update menu
         update_menu = tk.Menu(menu_bar, tearoff=0)
         update_menu.add_command(label="Query",
-                                command=lambda: self.showframe("Query_Page"))
+                                command=partial(self.showframe, "Query_Page"))
         update_menu.add_command(label="Delete",
-                                command=lambda: self.showframe("Delete_Page"))
+                                command=partial(self.showframe, "Delete_Page"))
         update_menu.add_command(label="Update",
-                                command=lambda: self.showframe("Update_Page"))
+                                command=partial(self.showframe, "Update_Page"))
         menu_bar.add_cascade(label="Update", menu=update_menu)
 
         # add help menu
         help_menu = tk.Menu(menu_bar, tearoff=0)
         help_menu.add_command(label="About",
-                              command=lambda: self.showframe("home_page"))
+                              command=partial(self.showframe, "home_page"))
         help_menu.add_command(label="Version",
                               command=lambda: print("version 1.1"))
         menu_bar.add_cascade(label="Help", menu=help_menu)
@@ -61,7 +86,49 @@ class Main_Page:
 
     # show a frame by name
     def showframe(self, name: str):
-        self.pages[name].tkraise()
+        raiser = self._raisers.get(name)
+        if raiser is None:
+            page = self._page_classes[name](self.container_frame, self)
+            page.grid(row=0, column=0, sticky="nsew")
+            self.pages[name] = page
+            raiser = self._raisers[name] = page.tkraise
+        raiser()
+
+    # queue fn to run on the Tk main thread (safe to call from any thread)
+    def run_on_main(self, fn):
+        self._main_calls.put(fn)
+
+    # run the queued callbacks, Tk is only ever touched from this thread
+    def _poll_main(self):
+        while True:
+            try:
+                fn = self._main_calls.get_nowait()
+            except queue.Empty:
+                break
+            fn()
+        self._poll_job = self.root.after(50, self._poll_main)
+
+    # write pending student changes to disk
+    def save(self):
+        if self._repo is not None:
+            self.io_pool.submit(self._repo.flush)
+
+    # flush cached student data and close the window
+    def on_close(self):
+        # let the queued enrollments reach the file first; the worker only queues
+        # its callbacks (run_on_main), so waiting here can't deadlock on Tk
+        self.io_pool.shutdown(wait=True)
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+        if self._repo is not None:
+            self._repo.flush()
+        self.root.destroy()
+
+    @property
+    def repo(self) -> Student_Repository:
+        if self._repo is None:
+            self._repo = Student_Repository()
+        return self._repo
 
 
 # sub pages
@@ -73,7 +140,8 @@ class home_page(tk.Frame):
 class Enroll_Page(tk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
-        self.repo = Student_Repository()
+        self.controller = controller
+        self.repo = controller.repo
         ttk.Label(self, text="Enroll Page", font=("Arial", 16)).grid(
             row=0, column=0, columnspan=2, pady=(10, 5)
         )
@@ -99,30 +167,39 @@ class Enroll_Page(tk.Frame):
     
     def enroll(self):
         print("Enroll student:", self.name.get(), self.id.get(), self.math.get(), self.english.get())
-        sid = self.id.get().strip()
-        name = self.name.get().strip()
-        math = self.math.get().strip()
-        english = self.english.get().strip()
+        # strip every field once, everything below uses the cleaned values
+        sid, name, math, english = (
+            var.get().strip() for var in (self.id, self.name, self.math, self.english)
+        )
 
         # basic validation
         if not sid or not name:
             print("Invalid input")
             return
         # safe number validation
-        math_Val = float(math) if math.isnumeric() else None
-        english_Val = float(english) if english.isnumeric() else None
+        math_Val = _as_float(math)
+        english_Val = _as_float(english)
         
-        try:
-            self.repo.add(sid, name, math_Val, english_Val)
+        # save in the background, report back on the Tk main thread
+        future = self.controller.io_pool.submit(self.repo.add, sid, name, math_Val, english_Val)
+        future.add_done_callback(
+            lambda f: self.controller.run_on_main(
+                partial(self._on_enroll_done, f, sid, name, math_Val, english_Val)
+            )
+        )
+
+    def _on_enroll_done(self, future, sid, name, math_Val, english_Val):
+        e = future.exception()
+        if e is None:
             print("saved: ", sid, name, math_Val, english_Val)
             messagebox.showinfo(f"Success", f"Enrolled student {name} with ID {sid}")
             self.id.set("")
             self.name.set("")
             self.math.set("")
             self.english.set("")
-        except Exception as e:
+        else:
             print("Error:", e)
-            messagebox.showerror(f"Error", "Failed to enroll student {e}")
+            messagebox.showerror(f"Error", f"Failed to enroll student {e}")
 
 class Query_Page(tk.Frame):
     def __init__(self, parent, controller):
@@ -1,95 +1,255 @@
 import csv
+import functools
+import io
+import math as _math
+import operator
+import threading
+from array import array
 from pathlib import Path
 from typing import List, Dict, Optional
 
+# optional: pyarrow parses the whole file in C, fall back to the csv module without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# optional: numpy reduces the score columns in C
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# missing scores are stored as NaN in the float columns
+NAN = float("nan")
+# bound once, used to normalise ids and names
+_clean = str.strip
+
+def _parse_score(text: str) -> float:
+    # csv text -> float, empty or invalid -> NaN
+    try:
+        return float(text)
+    except ValueError:
+        return NAN
+
+def _to_score(value: str | float | None) -> float:
+    # score argument -> float, None, empty or invalid -> NaN
+    return NAN if value is None else _parse_score(value)
+
+def _format_score(value: float) -> str:
+    # float -> csv text, whole numbers without ".0" (as they were typed), NaN -> empty
+    if _math.isnan(value):
+        return ""
+    return str(int(value)) if value.is_integer() else str(value)
+
+def _locked(method):
+    # run the method while holding the repository lock
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class Student_Repository:
     # "simple csv file student repository"
-    def __init__(self, file_path: Path | None = None):
+    # csv files already checked/created in this process
+    _CSV_READY: set[Path] = set()
+
+    def __init__(self, file_path: Path | None = None, flush_every: int = 20):
         # default: stu.csv in current directory
         self.file_path = file_path or Path(__file__).with_name("stu.csv")
+        # rewrite the file after this many unsaved updates/deletes
+        self.flush_every = flush_every
         self.headers = ["id", "name", "math", "english"]
+        # the GUI writes on a worker thread while pages read on the Tk thread
+        self._lock = threading.RLock()
         self._ensure_csv()
+        self._load()
 
     def _ensure_csv(self) -> None:
-        # create csv file if not exist
-        if not self.file_path.exists():
+        # create csv file if not exist, write the header into an empty one
+        if self.file_path in self._CSV_READY:
+            return
+        if not self.file_path.exists() or self.file_path.stat().st_size == 0:
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
             with self.file_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
-
-    def _read_all(self) -> List[Dict[str, str]]:
-        # read all students from csv file
-        with self.file_path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            return [row for row in reader]
+                csv.writer(f).writerow(self.headers)
+        self._CSV_READY.add(self.file_path)
+
+    def _load(self) -> None:
+        # read csv file once and keep students cached as parallel columns
+        if not (pacsv is not None and self._load_arrow()):
+            self.ids: List[str] = []
+            self.names: List[str] = []
+            self.math = array("d")
+            self.english = array("d")
+            # rows are in fixed header order: id, name, math, english
+            for row in self._read_all():
+                self.ids.append(row[0])
+                self.names.append(row[1])
+                self.math.append(_parse_score(row[2]))
+                self.english.append(_parse_score(row[3]))
+        # id -> row index
+        self._by_id: Dict[str, int] = {sid: i for i, sid in enumerate(self.ids)}
+        self._dirty = False
+        self._pending = 0
+
+    def _load_arrow(self) -> bool:
+        # bulk load the columns with pyarrow, False if the file can't be typed cleanly
+        convert_options = pacsv.ConvertOptions(
+            column_types={"id": pa.string(), "name": pa.string(), "math": pa.float64(), "english": pa.float64()},
+            null_values=["", "None"],
+        )
+        try:
+            table = pacsv.read_csv(self.file_path, convert_options=convert_options)
+        except pa.ArrowInvalid:
+            return False
+        self._check_header(table.column_names)
+        self.ids = table.column("id").to_pylist()
+        self.names = table.column("name").to_pylist()
+        self.math = array("d", table.column("math").fill_null(NAN).to_pylist())
+        self.english = array("d", table.column("english").fill_null(NAN).to_pylist())
+        return True
+
+    def _check_header(self, header: List[str]) -> None:
+        # rows are read by position, so the columns must match exactly
+        if header != self.headers:
+            raise ValueError(f"{self.file_path} has columns {header}, expected {self.headers}")
+
+    def _row(self, i: int) -> Dict[str, str]:
+        # build the row dict for index i
+        return {
+            "id": self.ids[i],
+            "name": self.names[i],
+            "math": _format_score(self.math[i]),
+            "english": _format_score(self.english[i]),
+        }
+
+    def _read_all(self) -> List[List[str]]:
+        # read all student rows (without header) from csv file in one call
+        data = self.file_path.read_bytes().decode("utf-8")
+        reader = csv.reader(io.StringIO(data, newline=""))
+        header = next(reader, None)
+        if header is not None:
+            self._check_header(header)
+        return [row for row in reader if row]
     
-    def _write_all(self, rows: List[Dict[str, str]]) -> None:
-        # write all students to csv file
-        with self.file_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writeheader()
-            writer.writerows(rows)
+    def _write_all(self) -> None:
+        # write all students to csv file, built in memory and written in one call
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf)
+        writer.writerow(self.headers)
+        writer.writerows(zip(self.ids, self.names,
+                             map(_format_score, self.math),
+                             map(_format_score, self.english)))
+        self.file_path.write_text(buf.getvalue(), encoding="utf-8", newline="")
+
+    def _mark_dirty(self) -> None:
+        # defer the rewrite, but bound how many changes can be lost
+        self._dirty = True
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    @_locked
+    def flush(self) -> None:
+        # write cached rows back to csv file if anything changed
+        if self._dirty:
+            self._write_all()
+            self._dirty = False
+            self._pending = 0
 
     # add, delete, update, query, etc. functions here...
+    @_locked
     def add(self, sid: str, name: str, math:str | float | None, english:str | float | None) -> None:
         # add a new student to csv file
-        sid = sid.strip()
+        sid = _clean(sid)
         if not sid:
             raise ValueError("student id cannot be empty")
-        rows = self._read_all()
-        if any(row["id"] == sid for row in rows):
+        if sid in self._by_id:
             raise ValueError(f"student id {sid} already exists")
-        row = {"id": sid, "name": name.strip(), "math": str(math), "english": str(english)}
-        rows.append(row)
-        self._write_all(rows)
+        name = _clean(name)
+        math_val = _to_score(math)
+        english_val = _to_score(english)
+        # the file must hold the pending deletes/updates before a row is appended to it
+        self.flush()
+        # append only the new row instead of rewriting the whole file
+        with self.file_path.open("a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow((sid, name, _format_score(math_val), _format_score(english_val)))
+        self._by_id[sid] = len(self.ids)
+        self.ids.append(sid)
+        self.names.append(name)
+        self.math.append(math_val)
+        self.english.append(english_val)
 
+    @_locked
     def get(self, sid: str) -> Optional[Dict[str, str]]:
         # get a student by id
-        sid = sid.strip()
-        for r in self._read_all():
-            if r["id"] == sid:
-                return r
-        return None
+        i = self._by_id.get(_clean(sid))
+        return None if i is None else self._row(i)
 
+    @_locked
     def list(self) -> List[Dict[str, str]]:
         # list all students
-        return self._read_all().sort(key=lambda r: r["id"])
+        return sorted(map(self._row, range(len(self.ids))), key=operator.itemgetter("id"))
+    
+    @_locked
+    def mean_score(self, column: str) -> float:
+        # average of the "math" or "english" column, missing scores ignored
+        if column not in ("math", "english"):
+            raise ValueError(f"unknown score column {column}")
+        scores = getattr(self, column)
+        if np is not None:
+            # zero-copy view of the array('d') buffer
+            values = np.frombuffer(scores, dtype=np.float64)
+            values = values[~np.isnan(values)]
+            return float(values.mean()) if values.size else NAN
+        values = [v for v in scores if not _math.isnan(v)]
+        return sum(values) / len(values) if values else NAN
     
+    @_locked
     def update(self, sid: str, name: str | None = None, math: str | float | None = None, english: str | float | None = None) -> bool:
         # update a student by id
-        sid = sid.strip()
-        rows = self._read_all()
-        changed = False
-        for r in rows:
-            if r["id"] == sid:
-                if name is not None:
-                    r["name"] = name.strip()
-                if math is not None:
-                    r["math"] = "" if math is None or math == "" else str(math)
-                if english is not None:
-                    r["english"] = "" if english is None or english == "" else str(english)
-                changed = True
-                break
-        if changed:
-            self._write_all(rows)
-        
-        return changed
+        sid = _clean(sid)
+        i = self._by_id.get(sid)
+        if i is None:
+            return False
+        if name is not None:
+            self.names[i] = _clean(name)
+        if math is not None:
+            self.math[i] = _to_score(math)
+        if english is not None:
+            self.english[i] = _to_score(english)
+        self._mark_dirty()
+        return True
     
+    @_locked
     def delete(self, sid: str) -> bool:
         # delete a student by id
-        sid = sid.strip()
-        rows = self._read_all()
-        new_rows = [r for r in rows if r["id"] != sid]
-        if len(rows) != len(new_rows):
-            self._write_all(new_rows)
-            return True
-        else:
+        sid = _clean(sid)
+        i = self._by_id.pop(sid, None)
+        if i is None:
             return False
+        # move the last row into the freed slot, then drop the tail
+        last = len(self.ids) - 1
+        if i != last:
+            self.ids[i] = self.ids[last]
+            self.names[i] = self.names[last]
+            self.math[i] = self.math[last]
+            self.english[i] = self.english[last]
+            self._by_id[self.ids[i]] = i
+        self.ids.pop()
+        self.names.pop()
+        self.math.pop()
+        self.english.pop()
+        self._mark_dirty()
+        return True
     
+    @_locked
     def upsert(self, sid: str, name: str | None = None, math: str | float | None = None, english: str | float | None = None) -> None:
         # add or update a student by id
-        if self.get(sid) is None:
+        if _clean(sid) not in self._by_id:
             self.add(sid, name, math, english)
         else:
             self.update(sid, name, math, english)
@@ -0,0 +1,112 @@
+import csv
+import math as _math
+import operator
+import sqlite3
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# same score parsing and formatting as the csv repository, so the two are interchangeable
+from csv_repo import NAN, _format_score, _to_score
+
+class Student_SQLite_Repository:
+    # "sqlite student repository, same api as csv_repo.Student_Repository"
+    def __init__(self, db_path: Path | None = None):
+        # default: stu.sqlite3 in current directory
+        self.db_path = db_path or Path(__file__).with_name("stu.sqlite3")
+        self.headers = ["id", "name", "math", "english"]
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # the ui saves from a worker thread, so allow use outside the creating thread
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS stu("
+            "id TEXT PRIMARY KEY, name TEXT NOT NULL, math REAL, english REAL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _score(value: str | float | None) -> Optional[float]:
+        # score argument -> REAL column value, None, empty or invalid -> NULL
+        score = _to_score(value)
+        return None if _math.isnan(score) else score
+
+    @staticmethod
+    def _row(record: tuple) -> Dict[str, str]:
+        # db record -> row dict in the same string format as the csv repository
+        sid, name, math, english = record
+        return {
+            "id": sid,
+            "name": name,
+            "math": _format_score(NAN if math is None else math),
+            "english": _format_score(NAN if english is None else english),
+        }
+
+    def flush(self) -> None:
+        # every mutation commits on its own, kept for api parity
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add(self, sid: str, name: str, math: str | float | None, english: str | float | None) -> None:
+        # add a new student
+        sid = sid.strip()
+        if not sid:
+            raise ValueError("student id cannot be empty")
+        try:
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO stu(id, name, math, english) VALUES (?, ?, ?, ?)",
+                    (sid, name.strip(), self._score(math), self._score(english)),
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"student id {sid} already exists") from None
+
+    def get(self, sid: str) -> Optional[Dict[str, str]]:
+        # get a student by id
+        record = self._db.execute(
+            "SELECT id, name, math, english FROM stu WHERE id = ? LIMIT 1", (sid.strip(),)
+        ).fetchone()
+        return None if record is None else self._row(record)
+
+    def list(self) -> List[Dict[str, str]]:
+        # list all students
+        return [self._row(r) for r in self._db.execute("SELECT id, name, math, english FROM stu ORDER BY id")]
+
+    def update(self, sid: str, name: str | None = None, math: str | float | None = None, english: str | float | None = None) -> bool:
+        # update a student by id, None leaves a field unchanged
+        columns, values = [], []
+        if name is not None:
+            columns.append("name = ?")
+            values.append(name.strip())
+        if math is not None:
+            columns.append("math = ?")
+            values.append(self._score(math))
+        if english is not None:
+            columns.append("english = ?")
+            values.append(self._score(english))
+        sid = sid.strip()
+        with self._db:
+            if not columns:
+                return self._db.execute("SELECT 1 FROM stu WHERE id = ?", (sid,)).fetchone() is not None
+            cur = self._db.execute(f"UPDATE stu SET {', '.join(columns)} WHERE id = ?", (*values, sid))
+        return cur.rowcount > 0
+
+    def delete(self, sid: str) -> bool:
+        # delete a student by id
+        with self._db:
+            cur = self._db.execute("DELETE FROM stu WHERE id = ?", (sid.strip(),))
+        return cur.rowcount > 0
+
+    def upsert(self, sid: str, name: str | None = None, math: str | float | None = None, english: str | float | None = None) -> None:
+        # add or update a student by id
+        if self.get(sid) is None:
+            self.add(sid, name, math, english)
+        else:
+            self.update(sid, name, math, english)
+
+    def to_csv(self, file_path: Path) -> None:
+        # export all students in the csv repository format
+        with file_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.headers)
+            writer.writerows(map(operator.itemgetter(*self.headers), self.list()))
@@ -1,23 +1,31 @@
 -- database/sql/create_analytics_views.sql
 CREATE SCHEMA IF NOT EXISTS analytics;
+-- replace the plain views left by earlier runs (DROP VIEW refuses materialized views)
+DO $$
+BEGIN
+  DROP VIEW IF EXISTS analytics.traffic_flow, analytics.crash_drivers, analytics.crash_incidents;
+EXCEPTION WHEN wrong_object_type THEN NULL;
+END $$;
 -- 1. Traffic Flow view (cast types)
-CREATE OR REPLACE VIEW analytics.traffic_flow AS
+DROP MATERIALIZED VIEW IF EXISTS analytics.traffic_flow;
+CREATE MATERIALIZED VIEW analytics.traffic_flow AS
 SELECT site,
     day,
     NULLIF(date, '')::date AS date,
     NULLIF(start_time, '')::time AS start_time,
     NULLIF(end_time, '')::time AS end_time,
-    NULLIF(flow, '')::numeric AS flow,
-    NULLIF(flow_pc, '')::numeric AS flow_pc,
-    NULLIF(cong, '')::numeric AS cong,
-    NULLIF(cong_pc, '')::numeric AS cong_pc,
-    NULLIF(dsat, '')::numeric AS dsat,
-    NULLIF(dsat_pc, '')::numeric AS dsat_pc,
+    flow,
+    flow_pc,
+    cong,
+    cong_pc,
+    dsat,
+    dsat_pc,
     "ObjectId" AS object_id,
     __ingested_at
 FROM staging.traffic_flow_sdcc_2023_h1;
 -- 2. Crash Drivers view (rename columns + cast datetime/numerics)
-CREATE OR REPLACE VIEW analytics.crash_drivers AS
+DROP MATERIALIZED VIEW IF EXISTS analytics.crash_drivers;
+CREATE MATERIALIZED VIEW analytics.crash_drivers AS
 SELECT "Report Number" AS report_number,
     "Local Case Number" AS local_case_number,
     "Agency Name" AS agency_name,
@@ -40,24 +48,25 @@ SELECT "Report Number" AS report_number,
     "Drivers License State" AS drivers_license_state,
     "Person ID" AS person_id,
     "Vehicle ID" AS vehicle_id,
-    NULLIF("Speed Limit", '')::int AS speed_limit,
+    "Speed Limit" AS speed_limit,
     "Vehicle Year" AS vehicle_year,
     "Vehicle Make" AS vehicle_make,
     "Vehicle Model" AS vehicle_model,
-    NULLIF("Latitude", '')::numeric AS latitude,
-    NULLIF("Longitude", '')::numeric AS longitude,
+    "Latitude" AS latitude,
+    "Longitude" AS longitude,
     "Location" AS location,
     __ingested_at
 FROM staging.crash_drivers_montgomery_md;
 -- 3. Cary Crash Incidents view (cast the key fields)
-CREATE OR REPLACE VIEW analytics.crash_incidents AS
-SELECT NULLIF(tamainid, '')::bigint AS tamainid,
+DROP MATERIALIZED VIEW IF EXISTS analytics.crash_incidents;
+CREATE MATERIALIZED VIEW analytics.crash_incidents AS
+SELECT tamainid,
     location_description,
-    NULLIF(lat2, '')::numeric AS lat2,
-    NULLIF(lon2, '')::numeric AS lon2,
+    lat2,
+    lon2,
     -- Keep other coords as optional
-    NULLIF(lat, '')::numeric AS lat,
-    NULLIF(lon, '')::numeric AS lon,
+    lat,
+    lon,
     NULLIF(crash_date, '')::timestamptz AS crash_date,
     NULLIF(ta_date, '')::date AS ta_date,
     ta_time,
@@ -77,13 +86,18 @@ SELECT NULLIF(tamainid, '')::bigint AS tamainid,
     vehicle3,
     vehicle4,
     vehicle5,
-    NULLIF(fatality, '')::int AS fatality,
+    fatality,
     fatalities,
     injuries,
-    NULLIF(possblinj, '')::int AS possible_injury,
-    NULLIF(numpassengers, '')::int AS num_passengers,
-    NULLIF(numpedestrians, '')::int AS num_pedestrians,
+    possblinj AS possible_injury,
+    numpassengers::int AS num_passengers,
+    numpedestrians::int AS num_pedestrians,
     year,
     month,
     __ingested_at
-FROM staging.crash_incidents_cary_nc;
\ No newline at end of file
+FROM staging.crash_incidents_cary_nc;
+-- indexes for the export queries' grouping columns
+CREATE INDEX IF NOT EXISTS ix_traffic_flow_site ON analytics.traffic_flow (site);
+CREATE INDEX IF NOT EXISTS ix_traffic_flow_start_hour ON analytics.traffic_flow ((EXTRACT(HOUR FROM start_time)));
+CREATE INDEX IF NOT EXISTS ix_crash_drivers_municipality ON analytics.crash_drivers (municipality);
+CREATE INDEX IF NOT EXISTS ix_crash_incidents_weather ON analytics.crash_incidents (weather);
@@ -1,20 +1,11 @@
 from __future__ import annotations
-import psycopg2
 from dagster import asset
 
 from src.utils.config import PostgresConfig
+from src.storage.postgres_io import pooled_conn
 from src.ingestion.run_ingestion import run_ingestion
 from src.analysis.export_sql_outputs import run_export_outputs
 
-def _get_conn():
-    cfg = PostgresConfig()
-    return psycopg2.connect(
-        host=cfg.host,
-        port=cfg.port,
-        database=cfg.db,
-        user=cfg.user,
-        password=cfg.password,
-    )
 # 1. Ingestion assets: raw files -> staging tables
 @asset
 def ingest_to_postgres(context) -> None:
@@ -26,29 +17,37 @@ def ingest_to_postgres(context) -> None:
 # 2. Create analytics views assets: staging tables -> analytics views
 @asset(deps=[ingest_to_postgres])
 def create_analytics_views(context) -> None:
-    # create analytics views in Postgres schema
+    # (re)build the analytics materialized views over the freshly ingested staging tables
     context.log.info("Creating analytics views")
     sql = """
     CREATE SCHEMA IF NOT EXISTS analytics;
+    -- replace the plain views left by earlier runs (DROP VIEW refuses materialized views)
+    DO $$
+    BEGIN
+      DROP VIEW IF EXISTS analytics.traffic_flow, analytics.crash_drivers, analytics.crash_incidents;
+    EXCEPTION WHEN wrong_object_type THEN NULL;
+    END $$;
 
-    CREATE OR REPLACE VIEW analytics.traffic_flow AS
+    DROP MATERIALIZED VIEW IF EXISTS analytics.traffic_flow;
+    CREATE MATERIALIZED VIEW analytics.traffic_flow AS
     SELECT
       site,
       day,
       NULLIF(date, '')::date                AS date,
       NULLIF(start_time, '')::time          AS start_time,
       NULLIF(end_time, '')::time            AS end_time,
-      NULLIF(flow, '')::numeric             AS flow,
-      NULLIF(flow_pc, '')::numeric          AS flow_pc,
-      NULLIF(cong, '')::numeric             AS cong,
-      NULLIF(cong_pc, '')::numeric          AS cong_pc,
-      NULLIF(dsat, '')::numeric             AS dsat,
-      NULLIF(dsat_pc, '')::numeric          AS dsat_pc,
+      flow,
+      flow_pc,
+      cong,
+      cong_pc,
+      dsat,
+      dsat_pc,
       "ObjectId"                            AS object_id,
       __ingested_at
     FROM staging.traffic_flow_sdcc_2023_h1;
 
-    CREATE OR REPLACE VIEW analytics.crash_drivers AS
+    DROP MATERIALIZED VIEW IF EXISTS analytics.crash_drivers;
+    CREATE MATERIALIZED VIEW analytics.crash_drivers AS
     SELECT
       "Report Number"                          AS report_number,
       "Local Case Number"                      AS local_case_number,
@@ -72,24 +71,25 @@ def create_analytics_views(context) -> None:
       "Drivers License State"                  AS drivers_license_state,
       "Person ID"                              AS person_id,
       "Vehicle ID"                             AS vehicle_id,
-      NULLIF("Speed Limit",'')::int            AS speed_limit,
+      "Speed Limit"                            AS speed_limit,
       "Vehicle Year"                           AS vehicle_year,
       "Vehicle Make"                           AS vehicle_make,
       "Vehicle Model"                          AS vehicle_model,
-      NULLIF("Latitude",'')::numeric           AS latitude,
-      NULLIF("Longitude",'')::numeric          AS longitude,
+      "Latitude"                               AS latitude,
+      "Longitude"                              AS longitude,
       "Location"                               AS location,
       __ingested_at
     FROM staging.crash_drivers_montgomery_md;
 
-    CREATE OR REPLACE VIEW analytics.crash_incidents AS
+    DROP MATERIALIZED VIEW IF EXISTS analytics.crash_incidents;
+    CREATE MATERIALIZED VIEW analytics.crash_incidents AS
     SELECT
-      NULLIF(tamainid,'')::bigint              AS tamainid,
+      tamainid,
       location_description,
-      NULLIF(lat2,'')::numeric                 AS lat2,
-      NULLIF(lon2,'')::numeric                 AS lon2,
-      NULLIF(lat,'')::numeric                  AS lat,
-      NULLIF(lon,'')::numeric                  AS lon,
+      lat2,
+      lon2,
+      lat,
+      lon,
       NULLIF(crash_date,'')::timestamptz       AS crash_date,
       NULLIF(ta_date,'')::date                 AS ta_date,
       ta_time,
@@ -105,25 +105,28 @@ def create_analytics_views(context) -> None:
       contributing_factor,
       vehicle_type,
       vehicle1, vehicle2, vehicle3, vehicle4, vehicle5,
-      NULLIF(fatality,'')::int                 AS fatality,
+      fatality,
       fatalities,
       injuries,
-      NULLIF(possblinj,'')::int                AS possible_injury,
-      NULLIF(numpassengers,'')::int            AS num_passengers,
-      NULLIF(numpedestrians,'')::int           AS num_pedestrians,
+      possblinj                                AS possible_injury,
+      numpassengers::int                       AS num_passengers,
+      numpedestrians::int                      AS num_pedestrians,
       year,
       month,
       __ingested_at
     FROM staging.crash_incidents_cary_nc;
+
+    -- indexes for the export queries' grouping columns
+    CREATE INDEX IF NOT EXISTS ix_traffic_flow_site ON analytics.traffic_flow (site);
+    CREATE INDEX IF NOT EXISTS ix_traffic_flow_start_hour ON analytics.traffic_flow ((EXTRACT(HOUR FROM start_time)));
+    CREATE INDEX IF NOT EXISTS ix_crash_drivers_municipality ON analytics.crash_drivers (municipality);
+    CREATE INDEX IF NOT EXISTS ix_crash_incidents_weather ON analytics.crash_incidents (weather);
     """
 
-    conn = _get_conn()
-    try:
+    with pooled_conn(PostgresConfig()) as conn:
         with conn.cursor() as cur:
             cur.execute(sql)
         conn.commit()
-    finally:
-        conn.close()
     context.log.info("Analytics views created")
 
 @asset(deps=[create_analytics_views])
@@ -8,63 +8,424 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from pymongo.errors import PyMongoError
 from scipy import stats
 
+# Optional: numba compiles the one-pass correlation kernel for large frames
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: pyarrow backs the on-disk Parquet cache of past months
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = ds = None
+
+# Optional: pyahocorasick finds every weather keyword in one pass per string
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many rows the NumPy correlation is already fast enough
+NUMBA_MIN_ROWS = 10_000
+
+# Group similar weather conditions (first matching group wins)
+WEATHER_GROUPS = {
+    'CLEAR': ['CLEAR', 'SUNNY', 'FAIR'],
+    'CLOUDY': ['CLOUDY', 'OVERCAST', 'PARTLY CLOUDY'],
+    'RAIN': ['RAIN', 'RAINING', 'DRIZZLE', 'SHOWER'],
+    'SNOW': ['SNOW', 'SNOWING', 'SLEET', 'ICE'],
+    'FOG': ['FOG', 'FOGGY', 'MIST', 'HAZE'],
+    'WIND': ['WIND', 'WINDY', 'GUSTY']
+}
+
+# One alternation regex per group, matched as plain substrings
+WEATHER_PATTERNS = {
+    group: re.compile('|'.join(map(re.escape, keywords)))
+    for group, keywords in WEATHER_GROUPS.items()
+}
+
+
+def _build_weather_automaton():
+    """Aho-Corasick automaton mapping each keyword to its group's rank"""
+    automaton = ahocorasick.Automaton()
+    for rank, keywords in enumerate(WEATHER_GROUPS.values()):
+        for keyword in keywords:
+            if keyword not in automaton:
+                automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+WEATHER_AUTOMATON = _build_weather_automaton() if ahocorasick is not None else None
+WEATHER_GROUP_NAMES = list(WEATHER_GROUPS)
+
+
+def _weather_group(weather: str) -> str:
+    """Group for a cleaned weather value, unmatched values keep their own name"""
+    if WEATHER_AUTOMATON is not None:
+        rank = min((rank for _, rank in WEATHER_AUTOMATON.iter(weather)), default=None)
+        return weather if rank is None else WEATHER_GROUP_NAMES[rank]
+    
+    for group, pattern in WEATHER_PATTERNS.items():
+        if pattern.search(weather):
+            return group
+    return weather
+
+
+# Injury severities from least to most severe, scored 1..5
+SEVERITY_CATS = [
+    'No Apparent Injury',
+    'Possible Injury',
+    'Suspected Minor Injury',
+    'Suspected Serious Injury',
+    'Fatal Injury'
+]
+
+
+# Scored server-side in the $group, missing or unknown values count as 1
+SEVERITY_SCORE_EXPR = {
+    "$switch": {
+        "branches": [
+            {"case": {"$eq": ["$collision_details.injury_severity", severity]}, "then": score}
+            for score, severity in enumerate(SEVERITY_CATS, start=1)
+        ],
+        "default": 1
+    }
+}
+
+
+def _weighted_bincount(df: pd.DataFrame, column: str, minlength: int) -> np.ndarray:
+    """Crash counts indexed by a small non-negative integer column (hour, day, month)"""
+    counts = np.bincount(
+        df[column].to_numpy(dtype=np.intp),
+        weights=df['crash_count'].to_numpy(dtype=np.float64),
+        minlength=minlength
+    )
+    return counts.astype(np.int64)
+
+
+def _series_to_int_dict(series: pd.Series) -> Dict[int, int]:
+    """{index: value} as plain ints, converted in bulk instead of per item"""
+    return dict(zip(
+        series.index.to_numpy().astype(int).tolist(),
+        series.to_numpy().astype(int).tolist()
+    ))
+
+
+def _nonzero_counts(counts: np.ndarray) -> Tuple[List[int], List[int]]:
+    """Positions and values of the non-zero entries of a bincount, as plain ints"""
+    positions = np.flatnonzero(counts)
+    return positions.tolist(), counts[positions].tolist()
+
+
+def _weighted_corr(x: pd.Series, y: pd.Series, weights: pd.Series) -> float:
+    """Pearson correlation of x and y where each row is repeated `weights` times"""
+    x = x.to_numpy(dtype=float)
+    y = y.to_numpy(dtype=float)
+    w = weights.to_numpy(dtype=float)
+    dx = x - np.average(x, weights=w)
+    dy = y - np.average(y, weights=w)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sum(w * dx * dy) / np.sqrt(np.sum(w * dx * dx) * np.sum(w * dy * dy))
+
+
+def _weighted_pearson_kernel(x, y, w):
+    """One pass over int arrays: weighted sums, squares and cross products -> Pearson r"""
+    n = sx = sy = sxx = syy = sxy = 0.0
+    for i in range(x.shape[0]):
+        wi = float(w[i])
+        xi = float(x[i])
+        yi = float(y[i])
+        n += wi
+        sx += wi * xi
+        sy += wi * yi
+        sxx += wi * xi * xi
+        syy += wi * yi * yi
+        sxy += wi * xi * yi
+    denominator = np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+    if denominator == 0.0:
+        return np.nan
+    return (n * sxy - sx * sy) / denominator
+
+
+if njit is not None:
+    _weighted_pearson_kernel = njit(cache=True)(_weighted_pearson_kernel)
+
+
+def _month_start(moment: datetime) -> datetime:
+    """First instant of the month containing moment"""
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(month_start: datetime) -> datetime:
+    """First instant of the month after month_start"""
+    return (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
 class TrafficAnalysisEngine:
     """Engine for performing traffic data analysis"""
     
-    def __init__(self, mongo_client, db_name: str = "traffic_safety_db"):
+    # Fetched frames are reused for this long (same window, same bucket)
+    CACHE_BUCKET_SECONDS = 300
+    
+    # Fetched frames kept in memory, least recently used dropped first
+    FRAME_CACHE_SIZE = 8
+    
+    # Documents per cursor batch when reading aggregate results
+    AGGREGATE_BATCH_SIZE = 50_000
+    
+    # Columns of the grouped crash frame and their (narrow) dtypes
+    FRAME_DTYPES = {
+        "hour": "int8",
+        "day_of_week": "int8",
+        "month": "int8",
+        "severity_score": "int8",
+        "weather": "category",
+        "crash_count": "int64"
+    }
+    
+    # Same key specs as crash_reporting_schema.json, so this is a no-op
+    # when SchemaManager already created them
+    CRASH_DATETIME_INDEX = [("crash_datetime", -1)]
+    CRASH_DATETIME_WEATHER_INDEX = [("crash_datetime", 1), ("environmental_conditions.weather", 1)]
+    
+    def __init__(self, mongo_client, db_name: str = "traffic_safety_db",
+                 cache_dir: Optional[Path] = None, cache_ttl: Optional[int] = None):
         self.client = mongo_client
         self.db = self.client[db_name]
+        # Whether this engine's crash_reports indexes were ensured, so aggregates can hint them
+        # (per engine: another client may reach a different server with the same db name)
+        self._indexed = False
+        # Parquet cache of whole past months (disabled without cache_dir, cache_ttl or pyarrow);
+        # files older than cache_ttl seconds are fetched again, and all of them once crash_reports changes
+        self.cache_dir = (Path(cache_dir)
+                          if cache_dir is not None and cache_ttl is not None and ds is not None else None)
+        self.cache_ttl = cache_ttl
+        # (days_back, time bucket or explicit end_date) -> (grouped frame, start_date, end_date)
+        self._frame_cache: "OrderedDict[Tuple[int, Any], Tuple[Optional[pd.DataFrame], datetime, datetime]]" = OrderedDict()
+        # Held for the whole fetch, so concurrent analyses share one query
+        self._frame_lock = threading.Lock()
+        self._ensure_indexes()
+        
+        if njit is not None:
+            # Compile (or load from cache) now rather than on the first analysis
+            _weighted_pearson_kernel(np.zeros(2, np.int8), np.ones(2, np.int8), np.ones(2, np.int64))
     
-    def perform_temporal_analysis(self, days_back: int = 365) -> Dict[str, Any]:
+    def _ensure_indexes(self) -> None:
+        """Make sure the crash_datetime range in every $match uses an index"""
+        try:
+            self.db.crash_reports.create_index(self.CRASH_DATETIME_INDEX, background=True)
+            self.db.crash_reports.create_index(self.CRASH_DATETIME_WEATHER_INDEX, background=True)
+            self._indexed = True
+        except PyMongoError as e:
+            logger.warning(f"Could not create crash_reports indexes: {e}")
+    
+    def _fetch_crash_frame(self, days_back: int,
+                           end_date: Optional[datetime] = None) -> Tuple[Optional[pd.DataFrame], datetime, datetime]:
         """
-        Analyze temporal patterns in crash data
+        Fetch crash counts grouped by every field the analyses use
+        
+        One row per hour/day/month/severity score/weather combination,
+        with crash_count holding how many crashes it stands for. Results are
+        memoized per days_back and end_date (per CACHE_BUCKET_SECONDS when it
+        defaults to now) so the temporal and weather analyses share a single query.
         
         Args:
             days_back: Number of days to look back
+            end_date: End of the window, defaults to now
             
         Returns:
-            Dictionary with temporal analysis results
+            (frame or None if no crashes, start_date, end_date)
         """
-        print("Performing temporal analysis...")
-        
-        try:
-            # Calculate date range
-            end_date = datetime.now()
+        with self._frame_lock:
+            if end_date is None:
+                end_date = datetime.now()
+                key = (days_back, int(end_date.timestamp()) // self.CACHE_BUCKET_SECONDS)
+            else:
+                key = (days_back, end_date)
+            cached = self._frame_cache.get(key)
+            if cached is not None:
+                self._frame_cache.move_to_end(key)
+                return cached
+            
             start_date = end_date - timedelta(days=days_back)
+            if self.cache_dir is None:
+                df = self._aggregate_crash_counts({"$gte": start_date, "$lte": end_date})
+            else:
+                df = self._fetch_with_month_cache(start_date, end_date)
             
-            # Query crash data
-            pipeline = [
-                {
-                    "$match": {
-                        "crash_datetime": {
-                            "$gte": start_date,
-                            "$lte": end_date
-                        }
-                    }
-                },
-                {
-                    "$project": {
+            # Validate the columns once here, so the analysis helpers can assume them
+            if df is not None:
+                missing = [name for name in self.FRAME_DTYPES if name not in df.columns]
+                if missing:
+                    raise ValueError(f"Crash frame is missing columns: {missing}")
+            
+            self._frame_cache[key] = (df, start_date, end_date)
+            if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+            return self._frame_cache[key]
+    
+    def _aggregate_crash_counts(self, datetime_range: Dict[str, datetime]) -> Optional[pd.DataFrame]:
+        """Run the grouping pipeline for one crash_datetime range ($gte/$lt/$lte bounds)"""
+        pipeline = [
+            {"$match": {"crash_datetime": datetime_range}},
+            {
+                "$group": {
+                    "_id": {
                         "hour": {"$hour": "$crash_datetime"},
                         "day_of_week": {"$dayOfWeek": "$crash_datetime"},
                         "month": {"$month": "$crash_datetime"},
-                        "year": {"$year": "$crash_datetime"},
-                        "injury_severity": "$collision_details.injury_severity",
+                        "severity_score": SEVERITY_SCORE_EXPR,
                         "weather": "$environmental_conditions.weather"
-                    }
+                    },
+                    "crash_count": {"$sum": 1}
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "hour": "$_id.hour",
+                    "day_of_week": "$_id.day_of_week",
+                    "month": "$_id.month",
+                    "severity_score": "$_id.severity_score",
+                    "weather": "$_id.weather",
+                    "crash_count": 1
                 }
-            ]
+            }
+        ]
+        
+        options = {"allowDiskUse": True, "batchSize": self.AGGREGATE_BATCH_SIZE}
+        if self._indexed:
+            options["hint"] = self.CRASH_DATETIME_INDEX
+        
+        # Read the cursor batch by batch straight into columns, so the
+        # result documents are never all held in memory at once
+        columns = {name: [] for name in self.FRAME_DTYPES}
+        for doc in self.db.crash_reports.aggregate(pipeline, **options):
+            for name, values in columns.items():
+                values.append(doc.get(name))
+        return pd.DataFrame(columns).astype(self.FRAME_DTYPES) if columns["crash_count"] else None
+    
+    def _data_version(self) -> str:
+        """Identify the crash_reports contents: document count plus newest _id (new on every load)"""
+        newest = self.db.crash_reports.find_one({}, projection={"_id": 1}, sort=[("_id", -1)])
+        count = self.db.crash_reports.estimated_document_count()
+        return f"{count}:{newest['_id'] if newest else ''}"
+    
+    def _check_cache_version(self) -> None:
+        """Drop the cached months if crash_reports changed since they were written"""
+        version = self._data_version()
+        version_file = self.cache_dir / "_data_version"  # "_" keeps it out of the Parquet dataset
+        if version_file.exists() and version_file.read_text() == version:
+            return
+        for period_dir in self.cache_dir.glob("period=*"):
+            shutil.rmtree(period_dir, ignore_errors=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        version_file.write_text(version)
+    
+    def _fetch_with_month_cache(self, start_date: datetime, end_date: datetime) -> Optional[pd.DataFrame]:
+        """
+        Fetch the grouped frame, reading whole past months from the Parquet cache
+        
+        Whole calendar months inside the window are stored under
+        cache_dir/period=YYYY-MM/ and read back through a dataset filter
+        on that partition, so only the requested months are touched.
+        The partial months at either edge of the window are always
+        queried live with the exact bounds.
+        """
+        month = start_date if start_date == _month_start(start_date) else _next_month(_month_start(start_date))
+        months = []
+        while _next_month(month) <= end_date:
+            months.append(month)
+            month = _next_month(month)
+        
+        if not months:
+            return self._aggregate_crash_counts({"$gte": start_date, "$lte": end_date})
+        
+        self._check_cache_version()
+        frames = [
+            self._aggregate_crash_counts({"$gte": start_date, "$lt": months[0]}),
+            self._aggregate_crash_counts({"$gte": _next_month(months[-1]), "$lte": end_date})
+        ]
+        
+        periods = []
+        for month in months:
+            period = month.strftime("%Y-%m")
+            path = self.cache_dir / f"period={period}" / "crash_counts.parquet"
+            fresh = path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl
+            if not fresh:
+                month_df = self._aggregate_crash_counts({"$gte": month, "$lt": _next_month(month)})
+                if month_df is None:
+                    # Cache empty months too, so they are not queried again
+                    month_df = pd.DataFrame({name: [] for name in self.FRAME_DTYPES}).astype(self.FRAME_DTYPES)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                month_df.to_parquet(path, engine="pyarrow", compression="snappy",
+                                    row_group_size=100_000, index=False)
+            periods.append(period)
+        
+        # Explicit schema, so an empty month's untyped weather column can't set the type for all of them
+        schema = pa.schema(
+            [(name, pa.string() if dtype == "category" else pa.from_numpy_dtype(np.dtype(dtype)))
+             for name, dtype in self.FRAME_DTYPES.items()] + [("period", pa.string())]
+        )
+        dataset = ds.dataset(
+            self.cache_dir, format="parquet", schema=schema,
+            partitioning=ds.partitioning(pa.schema([("period", pa.string())]), flavor="hive")
+        )
+        table = dataset.to_table(
+            columns=list(self.FRAME_DTYPES),
+            filter=ds.field("period").isin(periods)
+        )
+        frames.append(table.to_pandas())
+        
+        # The same key combination can show up in several segments, so re-sum per key
+        frames = [frame for frame in frames if frame is not None and len(frame)]
+        if not frames:
+            return None
+        keys = [name for name in self.FRAME_DTYPES if name != "crash_count"]
+        df = pd.concat([frame.astype({k: object for k in keys}) for frame in frames], ignore_index=True)
+        df = df.groupby(keys, dropna=False, sort=False, as_index=False)["crash_count"].sum()
+        return df.astype(self.FRAME_DTYPES)
+    
+    def perform_temporal_analysis(self, days_back: int = 365,
+                                  end_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Analyze temporal patterns in crash data
+        
+        Args:
+            days_back: Number of days to look back
+            end_date: End of the window, defaults to now
             
-            cursor = self.db.crash_reports.aggregate(pipeline)
-            data = list(cursor)
+        Returns:
+            Dictionary with temporal analysis results
+        """
+        print("Performing temporal analysis...")
+        
+        try:
+            df, start_date, end_date = self._fetch_crash_frame(days_back, end_date)
             
-            if not data:
+            if df is None:
                 return {"error": "No data found for temporal analysis"}
             
-            df = pd.DataFrame(data)
+            total_crashes = int(df['crash_count'].sum())
+            
+            # The three histograms every temporal metric is derived from
+            hour_counts = _weighted_bincount(df, 'hour', 24)
+            day_counts = _weighted_bincount(df, 'day_of_week', 8)
+            month_counts = _weighted_bincount(df, 'month', 13)
             
             # Calculate metrics
             results = {
@@ -74,93 +435,75 @@ class TrafficAnalysisEngine:
                     "end_date": end_date.isoformat(),
                     "days": days_back
                 },
-                "total_crashes": len(df),
-                "hourly_distribution": self._calculate_hourly_distribution(df),
-                "daily_distribution": self._calculate_daily_distribution(df),
-                "monthly_distribution": self._calculate_monthly_distribution(df),
-                "peak_hours": self._identify_peak_hours(df),
-                "weekend_vs_weekday": self._calculate_weekend_weekday_ratio(df),
-                "seasonal_patterns": self._identify_seasonal_patterns(df),
+                "total_crashes": total_crashes,
+                "hourly_distribution": self._calculate_hourly_distribution(hour_counts),
+                "daily_distribution": self._calculate_daily_distribution(day_counts),
+                "monthly_distribution": self._calculate_monthly_distribution(month_counts),
+                "peak_hours": self._identify_peak_hours(hour_counts),
+                "weekend_vs_weekday": self._calculate_weekend_weekday_ratio(day_counts),
+                "seasonal_patterns": self._identify_seasonal_patterns(month_counts),
                 "temporal_correlations": self._calculate_temporal_correlations(df)
             }
             
-            print(f"✓ Temporal analysis completed: {len(df)} crashes analyzed")
+            print(f"✓ Temporal analysis completed: {total_crashes} crashes analyzed")
             return results
             
         except Exception as e:
             logger.error(f"Error in temporal analysis: {e}")
             return {"error": str(e)}
     
-    def _calculate_hourly_distribution(self, df: pd.DataFrame) -> Dict[int, int]:
+    def _calculate_hourly_distribution(self, hour_counts: np.ndarray) -> Dict[int, int]:
         """Calculate crashes by hour"""
-        if 'hour' not in df.columns:
-            return {}
-        
-        hourly_counts = df['hour'].value_counts().sort_index()
-        return {int(hour): int(count) for hour, count in hourly_counts.items()}
+        hours, counts = _nonzero_counts(hour_counts)
+        return dict(zip(hours, counts))
     
-    def _calculate_daily_distribution(self, df: pd.DataFrame) -> Dict[str, int]:
+    def _calculate_daily_distribution(self, day_counts: np.ndarray) -> Dict[str, int]:
         """Calculate crashes by day of week"""
-        if 'day_of_week' not in df.columns:
-            return {}
-        
         # MongoDB dayOfWeek: 1=Sunday, 7=Saturday
         day_map = {
             1: "Sunday", 2: "Monday", 3: "Tuesday", 4: "Wednesday",
             5: "Thursday", 6: "Friday", 7: "Saturday"
         }
         
-        daily_counts = df['day_of_week'].value_counts().sort_index()
-        return {day_map.get(day, f"Day{day}"): int(count) 
-                for day, count in daily_counts.items()}
+        days, counts = _nonzero_counts(day_counts)
+        return dict(zip([day_map.get(day, f"Day{day}") for day in days], counts))
     
-    def _calculate_monthly_distribution(self, df: pd.DataFrame) -> Dict[str, int]:
+    def _calculate_monthly_distribution(self, month_counts: np.ndarray) -> Dict[str, int]:
         """Calculate crashes by month"""
-        if 'month' not in df.columns:
-            return {}
-        
         month_map = {
             1: "January", 2: "February", 3: "March", 4: "April",
             5: "May", 6: "June", 7: "July", 8: "August",
             9: "September", 10: "October", 11: "November", 12: "December"
         }
         
-        monthly_counts = df['month'].value_counts().sort_index()
-        return {month_map.get(month, f"Month{month}"): int(count) 
-                for month, count in monthly_counts.items()}
+        months, counts = _nonzero_counts(month_counts)
+        return dict(zip([month_map.get(month, f"Month{month}") for month in months], counts))
     
-    def _identify_peak_hours(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_peak_hours(self, counts: np.ndarray) -> Dict[str, Any]:
         """Identify peak crash hours"""
-        if 'hour' not in df.columns:
-            return {}
-        
-        hourly_counts = df['hour'].value_counts()
-        peak_hour = hourly_counts.idxmax()
-        peak_count = hourly_counts.max()
+        peak_hour = counts.argmax()
+        peak_count = counts[peak_hour]
+        total = counts.sum()
         
         # Identify rush hours (7-9 AM, 4-6 PM)
-        morning_rush = df[(df['hour'] >= 7) & (df['hour'] <= 9)].shape[0]
-        evening_rush = df[(df['hour'] >= 16) & (df['hour'] <= 18)].shape[0]
+        morning_rush = counts[7:10].sum()
+        evening_rush = counts[16:19].sum()
         
         return {
             "peak_hour": int(peak_hour),
             "peak_count": int(peak_count),
             "morning_rush_crashes": int(morning_rush),
             "evening_rush_crashes": int(evening_rush),
-            "rush_hour_percentage": float((morning_rush + evening_rush) / len(df) * 100)
+            "rush_hour_percentage": float((morning_rush + evening_rush) / total * 100)
         }
     
-    def _calculate_weekend_weekday_ratio(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_weekend_weekday_ratio(self, counts: np.ndarray) -> Dict[str, Any]:
         """Calculate weekend vs weekday crash ratio"""
-        if 'day_of_week' not in df.columns:
-            return {}
-        
         # Weekend days: 1 (Sunday) and 7 (Saturday)
-        weekend_mask = df['day_of_week'].isin([1, 7])
-        weekend_crashes = df[weekend_mask].shape[0]
-        weekday_crashes = df[~weekend_mask].shape[0]
+        weekend_crashes = counts[1] + counts[7]
+        total = counts.sum()
+        weekday_crashes = total - weekend_crashes
         
-        total = len(df)
         if total > 0:
             weekend_ratio = weekend_crashes / total
             weekday_ratio = weekday_crashes / total
@@ -175,11 +518,8 @@ class TrafficAnalysisEngine:
             "weekend_to_weekday_ratio": float(weekend_crashes / weekday_crashes if weekday_crashes > 0 else 0)
         }
     
-    def _identify_seasonal_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_seasonal_patterns(self, month_counts: np.ndarray) -> Dict[str, Any]:
         """Identify seasonal patterns in crashes"""
-        if 'month' not in df.columns:
-            return {}
-        
         # Define seasons
         season_map = {
             12: "Winter", 1: "Winter", 2: "Winter",
@@ -188,8 +528,12 @@ class TrafficAnalysisEngine:
             9: "Fall", 10: "Fall", 11: "Fall"
         }
         
-        df['season'] = df['month'].map(season_map)
-        seasonal_counts = df['season'].value_counts()
+        # Fold the twelve month totals into seasons
+        season_totals = {}
+        for month, count in zip(*_nonzero_counts(month_counts)):
+            season = season_map[month]
+            season_totals[season] = season_totals.get(season, 0) + count
+        seasonal_counts = pd.Series(season_totals, dtype=np.int64).sort_values(ascending=False)
         
         return {
             "seasonal_distribution": {season: int(count) 
@@ -204,34 +548,29 @@ class TrafficAnalysisEngine:
         correlations = {}
         
         try:
-            # Hour vs severity (if severity data available)
-            if 'hour' in df.columns and 'injury_severity' in df.columns:
-                # Create severity score (higher = more severe)
-                severity_map = {
-                    'No Apparent Injury': 1,
-                    'Possible Injury': 2,
-                    'Suspected Minor Injury': 3,
-                    'Suspected Serious Injury': 4,
-                    'Fatal Injury': 5
-                }
-                
-                df['severity_score'] = df['injury_severity'].map(
-                    lambda x: severity_map.get(x, 1) if pd.notna(x) else 1
+            # Hour vs severity
+            if njit is not None and len(df) >= NUMBA_MIN_ROWS:
+                hour_severity_corr = _weighted_pearson_kernel(
+                    df['hour'].to_numpy(np.int8),
+                    df['severity_score'].to_numpy(np.int8),
+                    df['crash_count'].to_numpy(np.int64)
                 )
-                
-                hour_severity_corr = df[['hour', 'severity_score']].corr().iloc[0, 1]
-                correlations['hour_severity_correlation'] = float(hour_severity_corr)
-        except:
-            pass
+            else:
+                hour_severity_corr = _weighted_corr(df['hour'], df['severity_score'], df['crash_count'])
+            correlations['hour_severity_correlation'] = float(hour_severity_corr)
+        except (KeyError, ValueError, ZeroDivisionError) as e:
+            logger.warning(f"Could not calculate hour/severity correlation: {e}")
         
         return correlations
     
-    def perform_weather_analysis(self, days_back: int = 365) -> Dict[str, Any]:
+    def perform_weather_analysis(self, days_back: int = 365,
+                                 end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Analyze weather impact on crashes
         
         Args:
             days_back: Number of days to look back
+            end_date: End of the window, defaults to now
             
         Returns:
             Dictionary with weather analysis results
@@ -239,61 +578,31 @@ class TrafficAnalysisEngine:
         print("Performing weather analysis...")
         
         try:
-            # Calculate date range
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days_back)
-            
-            # Query crash data with weather
-            pipeline = [
-                {
-                    "$match": {
-                        "crash_datetime": {
-                            "$gte": start_date,
-                            "$lte": end_date
-                        },
-                        "environmental_conditions.weather": {"$ne": None}
-                    }
-                },
-                {
-                    "$project": {
-                        "weather": "$environmental_conditions.weather",
-                        "injury_severity": "$collision_details.injury_severity",
-                        "collision_type": "$collision_details.collision_type",
-                        "hour": {"$hour": "$crash_datetime"}
-                    }
-                }
-            ]
+            df, start_date, end_date = self._fetch_crash_frame(days_back, end_date)
             
-            cursor = self.db.crash_reports.aggregate(pipeline)
-            data = list(cursor)
+            # Only crashes with a recorded weather condition
+            if df is not None:
+                df = df[df['weather'].notna()].copy()
+            else:
+                df = None
             
-            if not data:
+            if df is None or df.empty:
                 return {"error": "No data found for weather analysis"}
             
-            df = pd.DataFrame(data)
-            
-            # Clean weather categories
-            df['weather_clean'] = df['weather'].str.upper().str.strip()
+            total_crashes = int(df['crash_count'].sum())
             
-            # Group similar weather conditions
-            weather_groups = {
-                'CLEAR': ['CLEAR', 'SUNNY', 'FAIR'],
-                'CLOUDY': ['CLOUDY', 'OVERCAST', 'PARTLY CLOUDY'],
-                'RAIN': ['RAIN', 'RAINING', 'DRIZZLE', 'SHOWER'],
-                'SNOW': ['SNOW', 'SNOWING', 'SLEET', 'ICE'],
-                'FOG': ['FOG', 'FOGGY', 'MIST', 'HAZE'],
-                'WIND': ['WIND', 'WINDY', 'GUSTY']
+            # Clean and group weather conditions
+            # (on the few distinct categories, not on every row)
+            categories = df['weather'].cat.categories
+            groups = {
+                category: _weather_group(cleaned)
+                for category, cleaned in zip(categories, categories.str.upper().str.strip())
             }
+            df['weather_group'] = df['weather'].map(groups).astype(object)
             
-            def map_weather(weather_str):
-                if pd.isna(weather_str):
-                    return 'UNKNOWN'
-                for group, keywords in weather_groups.items():
-                    if any(keyword in weather_str for keyword in keywords):
-                        return group
-                return weather_str
-            
-            df['weather_group'] = df['weather_clean'].apply(map_weather)
+            # Crashes per weather group, largest first, shared by the count-based metrics
+            group_totals = df.groupby('weather_group')['crash_count'].sum().sort_values(ascending=False)
+            weather_counts = dict(zip(group_totals.index.tolist(), group_totals.to_numpy().tolist()))
             
             # Calculate metrics
             results = {
@@ -302,29 +611,23 @@ class TrafficAnalysisEngine:
                     "start_date": start_date.isoformat(),
                     "end_date": end_date.isoformat()
                 },
-                "total_crashes_analyzed": len(df),
-                "weather_distribution": self._calculate_weather_distribution(df),
+                "total_crashes_analyzed": total_crashes,
+                "weather_distribution": self._calculate_weather_distribution(weather_counts, total_crashes),
                 "weather_severity_analysis": self._analyze_weather_severity(df),
                 "weather_temporal_patterns": self._analyze_weather_temporal(df),
-                "clear_vs_adverse": self._compare_clear_adverse_weather(df),
-                "weather_risk_factors": self._calculate_weather_risk_factors(df)
+                "clear_vs_adverse": self._compare_clear_adverse_weather(weather_counts, total_crashes),
+                "weather_risk_factors": self._calculate_weather_risk_factors(weather_counts, total_crashes)
             }
             
-            print(f"✓ Weather analysis completed: {len(df)} crashes analyzed")
+            print(f"✓ Weather analysis completed: {total_crashes} crashes analyzed")
             return results
             
         except Exception as e:
             logger.error(f"Error in weather analysis: {e}")
             return {"error": str(e)}
     
-    def _calculate_weather_distribution(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_weather_distribution(self, weather_counts: Dict[str, int], total: int) -> Dict[str, Any]:
         """Calculate crash distribution by weather"""
-        if 'weather_group' not in df.columns:
-            return {}
-        
-        weather_counts = df['weather_group'].value_counts()
-        total = len(df)
-        
         distribution = {}
         for weather, count in weather_counts.items():
             percentage = count / total * 100 if total > 0 else 0
@@ -337,24 +640,16 @@ class TrafficAnalysisEngine:
     
     def _analyze_weather_severity(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze injury severity by weather"""
-        if 'weather_group' not in df.columns or 'injury_severity' not in df.columns:
-            return {}
-        
-        # Create severity score
-        severity_map = {
-            'No Apparent Injury': 1,
-            'Possible Injury': 2,
-            'Suspected Minor Injury': 3,
-            'Suspected Serious Injury': 4,
-            'Fatal Injury': 5
-        }
-        
-        df['severity_score'] = df['injury_severity'].map(
-            lambda x: severity_map.get(x, 1) if pd.notna(x) else 1
-        )
-        
-        # Calculate average severity by weather
-        severity_by_weather = df.groupby('weather_group')['severity_score'].agg(['mean', 'std', 'count'])
+        # Calculate average severity by weather from count-weighted sums
+        weighted = df.assign(
+            score_sum=df['crash_count'] * df['severity_score'],
+            score_sq_sum=df['crash_count'] * df['severity_score'] ** 2
+        ).groupby('weather_group')[['crash_count', 'score_sum', 'score_sq_sum']].sum()
+        count = weighted['crash_count']
+        mean = weighted['score_sum'] / count
+        # sample variance, like Series.std()
+        variance = ((weighted['score_sq_sum'] - count * mean ** 2) / (count - 1)).clip(lower=0)
+        severity_by_weather = pd.DataFrame({'mean': mean, 'std': np.sqrt(variance), 'count': count})
         
         results = {}
         for weather, row in severity_by_weather.iterrows():
@@ -368,53 +663,39 @@ class TrafficAnalysisEngine:
     
     def _analyze_weather_temporal(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze temporal patterns by weather"""
-        if 'weather_group' not in df.columns or 'hour' not in df.columns:
-            return {}
-        
         results = {}
-        weather_groups = df['weather_group'].unique()
+        # One pass: weather groups x hours, zero where a group has no crashes
+        pivot = df.groupby(['weather_group', 'hour'], sort=False)['crash_count'].sum() \
+            .unstack('hour', fill_value=0).sort_index(axis=1)
         
-        for weather in weather_groups:
-            weather_df = df[df['weather_group'] == weather]
-            hourly_counts = weather_df['hour'].value_counts().sort_index()
-            
-            if not hourly_counts.empty:
-                results[weather] = {
-                    "peak_hour": int(hourly_counts.idxmax()),
-                    "hourly_distribution": {int(hour): int(count) 
-                                          for hour, count in hourly_counts.items()}
-                }
+        for weather, hourly_counts in pivot.iterrows():
+            hourly_counts = hourly_counts[hourly_counts > 0]
+            results[weather] = {
+                "peak_hour": int(hourly_counts.idxmax()),
+                "hourly_distribution": _series_to_int_dict(hourly_counts)
+            }
         
         return results
     
-    def _compare_clear_adverse_weather(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _compare_clear_adverse_weather(self, weather_counts: Dict[str, int], total: int) -> Dict[str, Any]:
         """Compare clear vs adverse weather conditions"""
-        if 'weather_group' not in df.columns:
-            return {}
-        
         clear_conditions = ['CLEAR']
         adverse_conditions = ['RAIN', 'SNOW', 'FOG', 'WIND']
         
-        clear_df = df[df['weather_group'].isin(clear_conditions)]
-        adverse_df = df[df['weather_group'].isin(adverse_conditions)]
-        
-        total = len(df)
+        clear_crashes = sum(weather_counts.get(group, 0) for group in clear_conditions)
+        adverse_crashes = sum(weather_counts.get(group, 0) for group in adverse_conditions)
         
         return {
-            "clear_weather_crashes": len(clear_df),
-            "adverse_weather_crashes": len(adverse_df),
-            "clear_percentage": len(clear_df) / total * 100 if total > 0 else 0,
-            "adverse_percentage": len(adverse_df) / total * 100 if total > 0 else 0,
-            "clear_adverse_ratio": len(clear_df) / len(adverse_df) if len(adverse_df) > 0 else 0
+            "clear_weather_crashes": clear_crashes,
+            "adverse_weather_crashes": adverse_crashes,
+            "clear_percentage": clear_crashes / total * 100 if total > 0 else 0,
+            "adverse_percentage": adverse_crashes / total * 100 if total > 0 else 0,
+            "clear_adverse_ratio": clear_crashes / adverse_crashes if adverse_crashes > 0 else 0
         }
     
-    def _calculate_weather_risk_factors(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_weather_risk_factors(self, weather_counts: Dict[str, int], total: int) -> Dict[str, Any]:
         """Calculate risk factors for different weather conditions"""
-        if 'weather_group' not in df.columns:
-            return {}
-        
         # Calculate relative risk compared to clear weather
-        weather_counts = df['weather_group'].value_counts()
         clear_count = weather_counts.get('CLEAR', 0)
         
         risk_factors = {}
@@ -423,7 +704,7 @@ class TrafficAnalysisEngine:
                 risk_factor = 1.0
             else:
                 # Adjust for total crashes in each weather type
-                risk_factor = (count / clear_count) * (len(df) / count)
+                risk_factor = (count / clear_count) * (total / count)
             
             risk_factors[weather] = {
                 "risk_factor": float(risk_factor),
@@ -433,12 +714,14 @@ class TrafficAnalysisEngine:
         
         return risk_factors
     
-    def perform_comprehensive_analysis(self, days_back: int = 365) -> Dict[str, Any]:
+    def perform_comprehensive_analysis(self, days_back: int = 365,
+                                       end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Perform comprehensive analysis combining all analyses
         
         Args:
             days_back: Number of days to look back
+            end_date: End of the window, defaults to now
             
         Returns:
             Dictionary with comprehensive analysis results
@@ -446,17 +729,23 @@ class TrafficAnalysisEngine:
         print("Performing comprehensive analysis...")
         
         try:
-            # Run all analyses
-            temporal_results = self.perform_temporal_analysis(days_back)
-            weather_results = self.perform_weather_analysis(days_back)
+            # One window end for both analyses, so their edges always agree
+            if end_date is None:
+                end_date = datetime.now()
+            
+            # Run both analyses at once, they share one fetch through the memo
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                temporal_future = executor.submit(self.perform_temporal_analysis, days_back, end_date)
+                weather_future = executor.submit(self.perform_weather_analysis, days_back, end_date)
+                temporal_results, weather_results = temporal_future.result(), weather_future.result()
             
             # Combine results
             comprehensive_results = {
                 "analysis_type": "comprehensive_analysis",
-                "analysis_timestamp": datetime.now().isoformat(),
+                "analysis_timestamp": end_date.isoformat(),
                 "time_period": {
                     "days_back": days_back,
-                    "analysis_date": datetime.now().strftime("%Y-%m-%d")
+                    "analysis_date": end_date.strftime("%Y-%m-%d")
                 },
                 "temporal_analysis": temporal_results,
                 "weather_analysis": weather_results,
@@ -3,40 +3,237 @@ Traffic Data Visualization Engine
 Independent class for generating visualizations from analysis results
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib import colormaps
+from matplotlib.artist import setp
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties, findfont
+from matplotlib.lines import Line2D
 import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
+import io
+import multiprocessing
 import os
-import pandas as pd
 from matplotlib import gridspec
 
+# Optional: mplcairo fills bar/pie patches faster than Agg, same output API
+try:
+    from mplcairo.base import FigureCanvasCairo as _FigureCanvas
+except ImportError:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvas
+
+_MONTH_ORDER = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+# Month -> bar color of its season (Winter, Spring, Summer, Fall)
+_MONTH_SEASON_COLOR = {
+    'December': 'lightblue', 'January': 'lightblue', 'February': 'lightblue',
+    'March': 'lightgreen', 'April': 'lightgreen', 'May': 'lightgreen',
+    'June': 'gold', 'July': 'gold', 'August': 'gold',
+    'September': 'orange', 'October': 'orange', 'November': 'orange',
+}
+_DAY_ORDER = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_WEEKEND = frozenset({'Saturday', 'Sunday'})
+# (family, size, weight) of every text style the charts use, resolved once by _prewarm_fonts
+_CHART_FONTS = (
+    [('sans-serif', size, 'normal') for size in (9, 10, 11, 12)]
+    + [('sans-serif', size, 'bold') for size in (9, 10, 11, 12, 14, 16, 18, 20)]
+    + [('monospace', size, 'normal') for size in (10, 11)]
+)
+
+
+def _new_figure(figsize, **kwargs) -> Figure:
+    """
+    A Figure with its own canvas (mplcairo or Agg), kept out of pyplot's figure registry.
+    Constrained layout is applied while drawing, so no tight_layout/tight bbox pass is needed
+    """
+    fig = Figure(figsize=figsize, layout='constrained', **kwargs)
+    _FigureCanvas(fig)
+    return fig
+
+
+@lru_cache(maxsize=64)
+def _sample_cmap(name: str, n: int, lo: float = 0.0, hi: float = 1.0) -> Tuple[Tuple[float, ...], ...]:
+    """n evenly spaced RGBA colors from the named colormap between lo and hi, memoized"""
+    return tuple(map(tuple, colormaps[name](np.linspace(lo, hi, n))))
+
+
+def _unpack(data: Dict[str, Dict[str, Any]], fields: Tuple[str, ...],
+            limit: Optional[int] = None) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """Names and one float array per field from the first limit entries of {name: {field: value}}"""
+    items = list(islice(data.items(), limit))
+    columns = {field: np.empty(len(items)) for field in fields}
+    for i, (_, values) in enumerate(items):
+        for field in fields:
+            columns[field][i] = values[field]
+    return [name for name, _ in items], columns
+
+
+def _write_file(filename: str, data: bytes):
+    """Write an encoded chart to disk (runs on the engine's I/O thread)"""
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+# Encoder options per chart format: light zlib compression for PNG, fast lossy encoding for previews
+_FORMAT_PIL_KWARGS = {
+    'png': {'compress_level': 1},
+    'webp': {'quality': 85, 'method': 4},
+    'jpg': {'quality': 85},
+}
+
+# Per-process engines for pool workers, so each worker keeps its figure cache between tasks
+_worker_engines: Dict[Tuple[str, int, str, int], "TrafficVisualizationEngine"] = {}
+
+
+def _run_chart(config: Tuple[str, int, str, int], method: str, args: tuple, kwargs: dict) -> str:
+    """Process pool entry point: draw one chart with this worker's engine for (output_dir, dpi, fmt, dashboard_dpi)"""
+    engine = _worker_engines.get(config)
+    if engine is None:
+        engine = _worker_engines[config] = TrafficVisualizationEngine(*config, workers=1)
+    filename = getattr(engine, method)(*args, **kwargs)
+    engine._flush_writes()
+    return filename
+
+
 class TrafficVisualizationEngine:
     """Engine for generating traffic data visualizations"""
     
-    def __init__(self, output_dir: str = "reports/visualizations"):
+    def __init__(self, output_dir: str = "reports/visualizations", dpi: int = 150,
+                 fmt: str = "png", dashboard_dpi: Optional[int] = None, workers: Optional[int] = None):
         self.output_dir = output_dir
+        # Screen resolution charts, PNG by default; webp/jpg encode faster for previews
+        # (the format is given so savefig doesn't go by the file name)
+        if fmt not in _FORMAT_PIL_KWARGS:
+            raise ValueError(f"Unsupported chart format: {fmt}")
+        self._dpi = dpi
+        self._fmt = fmt
+        self._savefig_kwargs = {'format': fmt, 'dpi': self._dpi, 'pil_kwargs': _FORMAT_PIL_KWARGS[fmt]}
+        # The 20x16 inch dashboards are mostly text panels and stay legible at a lower dpi
+        self._dashboard_dpi = dashboard_dpi or dpi
+        # One figure per size/layout, cleared and redrawn for each chart of that shape
+        self._fig_cache: Dict[Tuple, Figure] = {}
+        # Independent charts are drawn in worker processes; 1 draws everything in-process
+        self._workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        # Encoded charts are written to disk in the background while the next one draws
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes: List[Future] = []
         self._setup_directories()
+        self._prewarm_fonts()
+        
+    def _prewarm_fonts(self):
+        """Resolve the chart fonts up front so the first chart doesn't pay for the lookups"""
+        for family, size, weight in _CHART_FONTS:
+            findfont(FontProperties(family=family, size=size, weight=weight))
+    
+    def _get_fig(self, figsize: Tuple[int, int], **kwargs) -> Figure:
+        """Cleared figure of the given size (and Figure kwargs), reused across charts"""
+        key = (figsize, tuple(sorted(kwargs.items())))
+        fig = self._fig_cache.get(key)
+        if fig is None:
+            fig = self._fig_cache[key] = _new_figure(figsize, **kwargs)
+        else:
+            fig.clear()
+        return fig
+    
+    def _save(self, fig: Figure, filename: str, dpi: Optional[int] = None):
+        """Encode the figure in memory (at dpi if given) and queue the write to filename"""
+        kwargs = self._savefig_kwargs if dpi is None else {**self._savefig_kwargs, 'dpi': dpi}
+        buf = io.BytesIO()
+        fig.savefig(buf, **kwargs)
+        self._pending_writes.append(self._io_pool.submit(_write_file, filename, buf.getvalue()))
+    
+    def _flush_writes(self):
+        """Wait for the queued chart writes, re-raising any I/O error"""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+    
+    def _run_charts(self, tasks: List[Tuple[str, tuple, dict]], dashboard=None) -> List[str]:
+        """
+        Draw (method name, args, kwargs) chart tasks, in the process pool when there is
+        more than one worker, while the optional dashboard callable is drawn here
         
+        Returns:
+            File paths in task order, followed by the dashboard's
+        """
+        workers = min(self._workers, len(tasks))
+        if workers > 1:
+            if self._pool_workers < workers:
+                # spawned workers, as forking a process that runs threads (the chart writers) can deadlock
+                if self._pool is not None:
+                    self._pool.shutdown()
+                self._pool = ProcessPoolExecutor(max_workers=workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+                self._pool_workers = workers
+            futures = [self._pool.submit(_run_chart, (self.output_dir, self._dpi, self._fmt, self._dashboard_dpi),
+                                         method, args, kwargs)
+                       for method, args, kwargs in tasks]
+            dashboard_file = dashboard() if dashboard else None
+            generated_files = [future.result() for future in futures]
+        else:
+            generated_files = [getattr(self, method)(*args, **kwargs) for method, args, kwargs in tasks]
+            dashboard_file = dashboard() if dashboard else None
+        if dashboard:
+            generated_files.append(dashboard_file)
+        return generated_files
+    
+    def close_all(self):
+        """Finish pending writes, drop the cached figures and shut down the chart worker pool"""
+        self._flush_writes()
+        for fig in self._fig_cache.values():
+            fig.clear()
+        self._fig_cache.clear()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+    
     def _setup_directories(self):
-        """Create necessary directories"""
-        directories = [
-            self.output_dir,
-            f"{self.output_dir}/temporal",
-            f"{self.output_dir}/weather",
-            f"{self.output_dir}/comprehensive"
-        ]
+        """Create necessary directories, kept in self._dirs by chart category"""
+        self._dirs = {category: f"{self.output_dir}/{category}"
+                      for category in ("temporal", "weather", "comprehensive")}
         
-        for directory in directories:
+        for directory in self._dirs.values():
             os.makedirs(directory, exist_ok=True)
     
-    def generate_temporal_visualizations(self, analysis_results: Dict[str, Any]) -> List[str]:
+    def _new_run(self) -> str:
+        """Fresh timestamp for the chart file names of one run"""
+        return datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    def generate_all(self, temporal_results: Dict[str, Any], weather_results: Dict[str, Any],
+                     comprehensive_results: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Generate the temporal, weather and comprehensive visualizations as one run
+        
+        Args:
+            temporal_results: Results from temporal analysis
+            weather_results: Results from weather analysis
+            comprehensive_results: Results from comprehensive analysis
+            
+        Returns:
+            Generated file paths by category, all sharing one timestamp
+        """
+        timestamp = self._new_run()
+        return {
+            "temporal": self.generate_temporal_visualizations(temporal_results, timestamp),
+            "weather": self.generate_weather_visualizations(weather_results, timestamp),
+            "comprehensive": self.generate_comprehensive_visualizations(comprehensive_results, timestamp),
+        }
+    
+    def generate_temporal_visualizations(self, analysis_results: Dict[str, Any],
+                                         timestamp: Optional[str] = None) -> List[str]:
         """
         Generate visualizations for temporal analysis
         
         Args:
             analysis_results: Results from temporal analysis
+            timestamp: File name timestamp shared with the rest of a run, a new one if not given
             
         Returns:
             List of file paths for generated charts
@@ -47,94 +244,85 @@ class TrafficVisualizationEngine:
             print(f"Error in analysis results: {analysis_results['error']}")
             return []
         
-        generated_files = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self._new_run()
+        tasks = []
         
         # 1. Hourly Distribution Chart
         if "hourly_distribution" in analysis_results:
-            filepath = self._create_hourly_distribution_chart(
-                analysis_results["hourly_distribution"],
-                analysis_results.get("peak_hours", {}),
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_hourly_distribution_chart",
+                          (analysis_results["hourly_distribution"],
+                           analysis_results.get("peak_hours", {}),
+                           timestamp),
+                          {"total": analysis_results.get("total_crashes")}))
         
         # 2. Daily Distribution Chart
         if "daily_distribution" in analysis_results:
-            filepath = self._create_daily_distribution_chart(
-                analysis_results["daily_distribution"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_daily_distribution_chart",
+                          (analysis_results["daily_distribution"], timestamp), {}))
         
         # 3. Monthly Distribution Chart
         if "monthly_distribution" in analysis_results:
-            filepath = self._create_monthly_distribution_chart(
-                analysis_results["monthly_distribution"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_monthly_distribution_chart",
+                          (analysis_results["monthly_distribution"], timestamp), {}))
         
         # 4. Peak Hours Analysis Chart
         if "peak_hours" in analysis_results:
-            filepath = self._create_peak_hours_chart(
-                analysis_results["peak_hours"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_peak_hours_chart",
+                          (analysis_results["peak_hours"], timestamp), {}))
         
         # 5. Weekend vs Weekday Chart
         if "weekend_vs_weekday" in analysis_results:
-            filepath = self._create_weekend_weekday_chart(
-                analysis_results["weekend_vs_weekday"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_weekend_weekday_chart",
+                          (analysis_results["weekend_vs_weekday"], timestamp), {}))
         
         # 6. Seasonal Patterns Chart
         if "seasonal_patterns" in analysis_results:
-            filepath = self._create_seasonal_patterns_chart(
-                analysis_results["seasonal_patterns"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_seasonal_patterns_chart",
+                          (analysis_results["seasonal_patterns"], timestamp), {}))
         
-        # 7. Comprehensive Temporal Dashboard
+        # 7. Comprehensive Temporal Dashboard, drawn here while the workers handle the charts
+        dashboard = None
         if all(key in analysis_results for key in ["hourly_distribution", "daily_distribution", 
                                                   "monthly_distribution", "peak_hours"]):
-            filepath = self._create_temporal_dashboard(
-                analysis_results,
-                timestamp
-            )
-            generated_files.append(filepath)
+            dashboard = lambda: self._create_temporal_dashboard(analysis_results, timestamp)
+        
+        generated_files = self._run_charts(tasks, dashboard)
         
+        self._flush_writes()
         print(f"✓ Generated {len(generated_files)} temporal visualizations")
         return generated_files
     
     def _create_hourly_distribution_chart(self, hourly_data: Dict[int, int], 
                                          peak_hours: Dict[str, Any], 
-                                         timestamp: str) -> str:
-        """Create chart for hourly crash distribution"""
-        plt.figure(figsize=(12, 6))
-        
-        hours = list(hourly_data.keys())
-        counts = list(hourly_data.values())
+                                         timestamp: str, total: Optional[int] = None,
+                                         ax: Optional[Axes] = None) -> Optional[str]:
+        """Create chart for hourly crash distribution, or draw it onto ax (returns None)"""
+        own_fig = ax is None
+        if own_fig:
+            fig = self._get_fig((12, 6))
+            ax = fig.add_subplot(111)
+        
+        n = len(hourly_data)
+        hours = np.fromiter(hourly_data.keys(), dtype=np.int32, count=n)
+        counts = np.fromiter(hourly_data.values(), dtype=np.int64, count=n)
+        ymax = counts.max() if n else 0
         
         # Create bar chart
-        bars = plt.bar(hours, counts, color='skyblue', alpha=0.7, edgecolor='navy', linewidth=1)
+        bars = ax.bar(hours, counts, color='skyblue', alpha=0.7, edgecolor='navy', linewidth=1)
         
         # Highlight peak hour
         if peak_hours and "peak_hour" in peak_hours:
             peak_hour = peak_hours["peak_hour"]
-            if peak_hour in hours:
-                idx = hours.index(peak_hour)
+            peak_idx = np.flatnonzero(hours == peak_hour)
+            if peak_idx.size:
+                idx = int(peak_idx[0])
                 bars[idx].set_color('red')
                 bars[idx].set_alpha(0.9)
                 
                 # Add annotation
-                plt.annotate(f'Peak: {counts[idx]} crashes',
+                ax.annotate(f'Peak: {counts[idx]} crashes',
                             xy=(peak_hour, counts[idx]),
-                            xytext=(peak_hour, counts[idx] + max(counts)*0.05),
+                            xytext=(peak_hour, counts[idx] + ymax*0.05),
                             ha='center',
                             arrowprops=dict(arrowstyle='->', color='red'),
                             fontsize=10, fontweight='bold')
@@ -142,126 +330,111 @@ class TrafficVisualizationEngine:
         # Highlight rush hours
         rush_hours = [(7, 9), (16, 18)]  # Morning and evening rush
         for start, end in rush_hours:
-            plt.axvspan(start-0.5, end+0.5, alpha=0.1, color='orange', label='Rush Hours')
+            ax.axvspan(start-0.5, end+0.5, alpha=0.1, color='orange', label='Rush Hours')
         
-        plt.title('Hourly Crash Distribution', fontsize=14, fontweight='bold', pad=20)
-        plt.xlabel('Hour of Day', fontsize=12)
-        plt.ylabel('Number of Crashes', fontsize=12)
-        plt.xticks(range(0, 24, 2))
-        plt.grid(True, alpha=0.3, axis='y')
+        ax.set_title('Hourly Crash Distribution', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xlabel('Hour of Day', fontsize=12)
+        ax.set_ylabel('Number of Crashes', fontsize=12)
+        ax.set_xticks(range(0, 24, 2))
+        ax.grid(True, alpha=0.3, axis='y')
         
         # Add total crashes
-        total_crashes = sum(counts)
-        plt.text(0.02, 0.98, f'Total Crashes: {total_crashes:,}',
-                transform=plt.gca().transAxes, fontsize=10,
+        total_crashes = total if total is not None else int(counts.sum())
+        ax.text(0.02, 0.98, f'Total Crashes: {total_crashes:,}',
+                transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
+        if not own_fig:
+            return None
         
-        filename = f"{self.output_dir}/temporal/hourly_distribution_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/hourly_distribution_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_daily_distribution_chart(self, daily_data: Dict[str, int], 
-                                        timestamp: str) -> str:
-        """Create chart for daily crash distribution"""
-        plt.figure(figsize=(10, 6))
+                                        timestamp: str, ax: Optional[Axes] = None) -> Optional[str]:
+        """Create chart for daily crash distribution, or draw it onto ax (returns None)"""
+        own_fig = ax is None
+        if own_fig:
+            fig = self._get_fig((10, 6))
+            ax = fig.add_subplot(111)
         
         # Ensure correct order of days
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        days = [day for day in day_order if day in daily_data]
-        counts = [daily_data[day] for day in days]
+        days = [day for day in _DAY_ORDER if day in daily_data]
+        counts = np.fromiter((daily_data[day] for day in days), dtype=np.int64, count=len(days))
         
         # Color weekends differently
-        colors = ['skyblue' if day not in ['Saturday', 'Sunday'] else 'lightcoral' for day in days]
+        colors = ['lightcoral' if day in _WEEKEND else 'skyblue' for day in days]
         
-        bars = plt.bar(days, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
+        bars = ax.bar(days, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
         
-        plt.title('Daily Crash Distribution', fontsize=14, fontweight='bold', pad=20)
-        plt.xlabel('Day of Week', fontsize=12)
-        plt.ylabel('Number of Crashes', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, alpha=0.3, axis='y')
+        ax.set_title('Daily Crash Distribution', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xlabel('Day of Week', fontsize=12)
+        ax.set_ylabel('Number of Crashes', fontsize=12)
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(True, alpha=0.3, axis='y')
         
         # Add average line
-        avg_count = np.mean(counts) if counts else 0
-        plt.axhline(y=avg_count, color='red', linestyle='--', alpha=0.7, label=f'Average: {avg_count:.1f}')
-        plt.legend()
+        avg_count = counts.mean() if counts.size else 0
+        ax.axhline(y=avg_count, color='red', linestyle='--', alpha=0.7, label=f'Average: {avg_count:.1f}')
+        ax.legend()
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, fmt='%d', padding=3, fontsize=9)
         
-        plt.tight_layout()
+        if not own_fig:
+            return None
         
-        filename = f"{self.output_dir}/temporal/daily_distribution_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/daily_distribution_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_monthly_distribution_chart(self, monthly_data: Dict[str, int], 
-                                          timestamp: str) -> str:
-        """Create chart for monthly crash distribution"""
-        plt.figure(figsize=(12, 6))
+                                          timestamp: str, ax: Optional[Axes] = None) -> Optional[str]:
+        """Create chart for monthly crash distribution, or draw it onto ax (returns None)"""
+        own_fig = ax is None
+        if own_fig:
+            fig = self._get_fig((12, 6))
+            ax = fig.add_subplot(111)
         
         # Ensure correct order of months
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        months = [month for month in month_order if month in monthly_data]
-        counts = [monthly_data[month] for month in months]
+        months = [month for month in _MONTH_ORDER if month in monthly_data]
+        counts = np.fromiter((monthly_data[month] for month in months), dtype=np.int64, count=len(months))
         
         # Color by season
-        season_colors = {
-            'Winter': 'lightblue',
-            'Spring': 'lightgreen',
-            'Summer': 'gold',
-            'Fall': 'orange'
-        }
-        
-        colors = []
-        for month in months:
-            if month in ['December', 'January', 'February']:
-                colors.append(season_colors['Winter'])
-            elif month in ['March', 'April', 'May']:
-                colors.append(season_colors['Spring'])
-            elif month in ['June', 'July', 'August']:
-                colors.append(season_colors['Summer'])
-            else:
-                colors.append(season_colors['Fall'])
+        colors = [_MONTH_SEASON_COLOR[month] for month in months]
         
-        bars = plt.bar(months, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
+        bars = ax.bar(months, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
         
-        plt.title('Monthly Crash Distribution', fontsize=14, fontweight='bold', pad=20)
-        plt.xlabel('Month', fontsize=12)
-        plt.ylabel('Number of Crashes', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, alpha=0.3, axis='y')
+        ax.set_title('Monthly Crash Distribution', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xlabel('Month', fontsize=12)
+        ax.set_ylabel('Number of Crashes', fontsize=12)
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(True, alpha=0.3, axis='y')
         
         # Add trend line
         if len(counts) >= 3:
-            x = range(len(counts))
-            z = np.polyfit(x, counts, 1)
-            p = np.poly1d(z)
-            plt.plot(months, p(x), "r--", alpha=0.8, linewidth=2, label='Trend')
-            plt.legend()
+            x = np.arange(len(counts))
+            coeffs = np.polynomial.polynomial.polyfit(x, counts.astype(np.float64), 1)
+            trend = np.polynomial.polynomial.polyval(x, coeffs)
+            ax.plot(months, trend, "r--", alpha=0.8, linewidth=2, label='Trend')
+            ax.legend()
         
-        plt.tight_layout()
+        if not own_fig:
+            return None
         
-        filename = f"{self.output_dir}/temporal/monthly_distribution_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/monthly_distribution_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_peak_hours_chart(self, peak_hours_data: Dict[str, Any], 
                                 timestamp: str) -> str:
         """Create chart for peak hours analysis"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig = self._get_fig((14, 6))
+        axes = fig.subplots(1, 2)
         fig.suptitle('Peak Hours Analysis', fontsize=16, fontweight='bold')
         
         # Subplot 1: Peak Hour Details
@@ -281,10 +454,7 @@ class TrafficVisualizationEngine:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=10)
+        ax1.bar_label(bars, fmt='%d', padding=3, fontsize=10)
         
         # Subplot 2: Rush Hour Percentage
         ax2 = axes[1]
@@ -307,18 +477,16 @@ class TrafficVisualizationEngine:
             autotext.set_color('white')
             autotext.set_fontweight('bold')
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/temporal/peak_hours_analysis_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/peak_hours_analysis_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_weekend_weekday_chart(self, weekend_data: Dict[str, Any], 
                                      timestamp: str) -> str:
         """Create chart for weekend vs weekday analysis"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig = self._get_fig((14, 6))
+        axes = fig.subplots(1, 2)
         fig.suptitle('Weekend vs Weekday Analysis', fontsize=16, fontweight='bold')
         
         # Subplot 1: Crash Counts
@@ -337,10 +505,7 @@ class TrafficVisualizationEngine:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
+        ax1.bar_label(bars, fmt='%d', padding=3, fontsize=12, fontweight='bold')
         
         # Subplot 2: Ratios
         ax2 = axes[1]
@@ -365,26 +530,23 @@ class TrafficVisualizationEngine:
         ax2.grid(True, alpha=0.3, axis='y')
         
         # Add ratio values
-        for bar, metric in zip(bars, metrics):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f'{metric:.3f}', ha='center', va='bottom', fontsize=10)
+        ax2.bar_label(bars, fmt='%.3f', padding=3, fontsize=10)
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/temporal/weekend_weekday_analysis_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/weekend_weekday_analysis_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_seasonal_patterns_chart(self, seasonal_data: Dict[str, Any], 
-                                    timestamp: str) -> str:
-        """Create chart for seasonal patterns"""
-        plt.figure(figsize=(10, 6))
-        
+                                    timestamp: str, ax: Optional[Axes] = None) -> Optional[str]:
+        """Create chart for seasonal patterns, or draw it onto ax (returns None)"""
+        own_fig = ax is None
         if "seasonal_distribution" not in seasonal_data:
-            return ""
+            return "" if own_fig else None
+        
+        if own_fig:
+            fig = self._get_fig((10, 6))
+            ax = fig.add_subplot(111)
         
         seasonal_dist = seasonal_data["seasonal_distribution"]
         
@@ -397,11 +559,11 @@ class TrafficVisualizationEngine:
         explode = [0.05 if season == seasonal_data.get("peak_season", "") else 0 
                 for season in seasons]
         
-        wedges, texts, autotexts = plt.pie(counts, labels=seasons, colors=colors,
+        wedges, texts, autotexts = ax.pie(counts, labels=seasons, colors=colors,
                                         explode=explode, autopct='%1.1f%%',
                                         shadow=True, startangle=90)
         
-        plt.title('Seasonal Crash Distribution', fontsize=14, fontweight='bold', pad=20)
+        ax.set_title('Seasonal Crash Distribution', fontsize=14, fontweight='bold', pad=20)
         
         # Highlight peak season
         peak_season = seasonal_data.get("peak_season")
@@ -412,16 +574,14 @@ class TrafficVisualizationEngine:
             
             # FIXED: Get the center of the wedge for annotation
             # Calculate the angle for the center of the wedge
-            total = sum(counts)
             start_angle = 90  # Because startangle=90
             
-            # Calculate the cumulative angles
-            cum_counts = 0
-            for i in range(idx):
-                cum_counts += counts[i]
+            # Cumulative counts up to and including each wedge
+            c = np.asarray(counts, dtype=np.float64)
+            cum = c.cumsum()
             
             # Calculate the angle for the center of this wedge
-            wedge_center_angle = start_angle + (cum_counts + counts[idx]/2) / total * 360
+            wedge_center_angle = start_angle + (cum[idx] - c[idx]/2) / cum[-1] * 360
             
             # Convert to radians and calculate x, y coordinates
             angle_rad = np.deg2rad(wedge_center_angle)
@@ -429,7 +589,7 @@ class TrafficVisualizationEngine:
             y = 0.8 * np.sin(angle_rad)
             
             # Add annotation with correct coordinates
-            plt.annotate(f'Peak Season\n{counts[idx]} crashes',
+            ax.annotate(f'Peak Season\n{counts[idx]} crashes',
                         xy=(x, y),
                         xytext=(1.2, 0.5),
                         arrowprops=dict(arrowstyle='->', color='red'),
@@ -442,80 +602,51 @@ class TrafficVisualizationEngine:
         
         # Add seasonal variation metric
         variation = seasonal_data.get("seasonal_variation", 0)
-        plt.text(0.5, -0.1, f'Seasonal Variation: {variation:.3f}',
-                transform=plt.gca().transAxes, ha='center',
+        ax.text(0.5, -0.1, f'Seasonal Variation: {variation:.3f}',
+                transform=ax.transAxes, ha='center',
                 fontsize=10, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
+        if not own_fig:
+            return None
         
-        filename = f"{self.output_dir}/temporal/seasonal_patterns_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/seasonal_patterns_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_temporal_dashboard(self, analysis_results: Dict[str, Any], 
                                   timestamp: str) -> str:
         """Create comprehensive temporal analysis dashboard"""
-        fig = plt.figure(figsize=(20, 16))
-        fig.suptitle('Temporal Analysis Dashboard', fontsize=18, fontweight='bold', y=0.98)
+        fig = self._get_fig((20, 16))
+        fig.suptitle('Temporal Analysis Dashboard', fontsize=18, fontweight='bold')
+        
+        peak_hours = analysis_results["peak_hours"]
+        weekend_data = analysis_results["weekend_vs_weekday"]
         
         # Create grid layout
-        gs = gridspec.GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+        gs = gridspec.GridSpec(3, 3, figure=fig)
         
         # 1. Hourly Distribution (top left)
-        ax1 = fig.add_subplot(gs[0, 0])
-        hourly_data = analysis_results["hourly_distribution"]
-        hours = list(hourly_data.keys())
-        counts = list(hourly_data.values())
-        ax1.bar(hours, counts, color='skyblue', alpha=0.7)
-        ax1.set_title('Hourly Distribution', fontsize=12, fontweight='bold')
-        ax1.set_xlabel('Hour')
-        ax1.set_ylabel('Crashes')
-        ax1.grid(True, alpha=0.3, axis='y')
-        ax1.set_xticks(range(0, 24, 3))
+        self._create_hourly_distribution_chart(
+            analysis_results["hourly_distribution"],
+            peak_hours,
+            timestamp,
+            total=analysis_results.get("total_crashes"),
+            ax=fig.add_subplot(gs[0, 0])
+        )
         
         # 2. Daily Distribution (top middle)
-        ax2 = fig.add_subplot(gs[0, 1])
-        daily_data = analysis_results["daily_distribution"]
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        days = [day for day in day_order if day in daily_data]
-        daily_counts = [daily_data[day] for day in days]
-        colors = ['skyblue' if day not in ['Saturday', 'Sunday'] else 'lightcoral' for day in days]
-        ax2.bar(days, daily_counts, color=colors, alpha=0.7)
-        ax2.set_title('Daily Distribution', fontsize=12, fontweight='bold')
-        ax2.set_xlabel('Day')
-        ax2.set_ylabel('Crashes')
-        ax2.grid(True, alpha=0.3, axis='y')
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._create_daily_distribution_chart(
+            analysis_results["daily_distribution"], timestamp, ax=fig.add_subplot(gs[0, 1])
+        )
         
         # 3. Monthly Distribution (top right)
-        ax3 = fig.add_subplot(gs[0, 2])
-        monthly_data = analysis_results["monthly_distribution"]
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        months = [month[:3] for month in month_order if month in monthly_data or 
-                 any(m.startswith(month) for m in monthly_data.keys())]
-        monthly_counts = []
-        for month in month_order:
-            for key in monthly_data.keys():
-                if key.startswith(month):
-                    monthly_counts.append(monthly_data[key])
-                    break
-            else:
-                monthly_counts.append(0)
-        monthly_counts = monthly_counts[:len(months)]
-        ax3.plot(months, monthly_counts, marker='o', linewidth=2, color='green')
-        ax3.fill_between(months, 0, monthly_counts, alpha=0.3, color='green')
-        ax3.set_title('Monthly Trend', fontsize=12, fontweight='bold')
-        ax3.set_xlabel('Month')
-        ax3.set_ylabel('Crashes')
-        ax3.grid(True, alpha=0.3)
-        plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45)
+        self._create_monthly_distribution_chart(
+            analysis_results["monthly_distribution"], timestamp, ax=fig.add_subplot(gs[0, 2])
+        )
         
         # 4. Peak Hours Analysis (middle left)
         ax4 = fig.add_subplot(gs[1, 0])
-        peak_hours = analysis_results["peak_hours"]
         labels = ['Peak', 'Morning\nRush', 'Evening\nRush']
         values = [peak_hours.get("peak_count", 0),
                  peak_hours.get("morning_rush_crashes", 0),
@@ -524,11 +655,9 @@ class TrafficVisualizationEngine:
         ax4.bar(labels, values, color=colors, alpha=0.7)
         ax4.set_title('Peak Hours Analysis', fontsize=12, fontweight='bold')
         ax4.set_ylabel('Crashes')
-        ax4.grid(True, alpha=0.3, axis='y')
         
         # 5. Weekend vs Weekday (middle middle)
         ax5 = fig.add_subplot(gs[1, 1])
-        weekend_data = analysis_results["weekend_vs_weekday"]
         labels = ['Weekend', 'Weekday']
         values = [weekend_data.get("weekend_crashes", 0),
                  weekend_data.get("weekday_crashes", 0)]
@@ -541,18 +670,8 @@ class TrafficVisualizationEngine:
             autotext.set_fontweight('bold')
         
         # 6. Seasonal Patterns (middle right)
-        ax6 = fig.add_subplot(gs[1, 2])
         seasonal_data = analysis_results["seasonal_patterns"]
-        if "seasonal_distribution" in seasonal_data:
-            seasonal_dist = seasonal_data["seasonal_distribution"]
-            season_order = ['Winter', 'Spring', 'Summer', 'Fall']
-            seasons = [s for s in season_order if s in seasonal_dist]
-            season_counts = [seasonal_dist[s] for s in seasons]
-            colors = ['lightblue', 'lightgreen', 'gold', 'orange']
-            ax6.bar(seasons, season_counts, color=colors, alpha=0.7)
-            ax6.set_title('Seasonal Distribution', fontsize=12, fontweight='bold')
-            ax6.set_ylabel('Crashes')
-            ax6.grid(True, alpha=0.3, axis='y')
+        self._create_seasonal_patterns_chart(seasonal_data, timestamp, ax=fig.add_subplot(gs[1, 2]))
         
         # 7. Key Metrics Summary (bottom row, full width)
         ax7 = fig.add_subplot(gs[2, :])
@@ -587,20 +706,19 @@ class TrafficVisualizationEngine:
                 fontsize=11, family='monospace', verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/temporal/temporal_dashboard_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['temporal']}/temporal_dashboard_{timestamp}.{self._fmt}"
+        self._save(fig, filename, dpi=self._dashboard_dpi)
         
         return filename
     
-    def generate_weather_visualizations(self, analysis_results: Dict[str, Any]) -> List[str]:
+    def generate_weather_visualizations(self, analysis_results: Dict[str, Any],
+                                        timestamp: Optional[str] = None) -> List[str]:
         """
         Generate visualizations for weather analysis
         
         Args:
             analysis_results: Results from weather analysis
+            timestamp: File name timestamp shared with the rest of a run, a new one if not given
             
         Returns:
             List of file paths for generated charts
@@ -611,143 +729,121 @@ class TrafficVisualizationEngine:
             print(f"Error in analysis results: {analysis_results['error']}")
             return []
         
-        generated_files = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self._new_run()
+        tasks = []
         
         # 1. Weather Distribution Chart
         if "weather_distribution" in analysis_results:
-            filepath = self._create_weather_distribution_chart(
-                analysis_results["weather_distribution"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_weather_distribution_chart",
+                          (analysis_results["weather_distribution"], timestamp),
+                          {"total": analysis_results.get("total_crashes_analyzed")}))
         
         # 2. Weather Severity Analysis Chart
         if "weather_severity_analysis" in analysis_results:
-            filepath = self._create_weather_severity_chart(
-                analysis_results["weather_severity_analysis"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_weather_severity_chart",
+                          (analysis_results["weather_severity_analysis"], timestamp), {}))
         
         # 3. Clear vs Adverse Weather Chart
         if "clear_vs_adverse" in analysis_results:
-            filepath = self._create_clear_adverse_chart(
-                analysis_results["clear_vs_adverse"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_clear_adverse_chart",
+                          (analysis_results["clear_vs_adverse"], timestamp), {}))
         
         # 4. Weather Risk Factors Chart
         if "weather_risk_factors" in analysis_results:
-            filepath = self._create_weather_risk_factors_chart(
-                analysis_results["weather_risk_factors"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_weather_risk_factors_chart",
+                          (analysis_results["weather_risk_factors"], timestamp), {}))
         
         # 5. Weather Temporal Patterns Chart
         if "weather_temporal_patterns" in analysis_results:
-            filepath = self._create_weather_temporal_chart(
-                analysis_results["weather_temporal_patterns"],
-                timestamp
-            )
-            generated_files.append(filepath)
+            tasks.append(("_create_weather_temporal_chart",
+                          (analysis_results["weather_temporal_patterns"], timestamp), {}))
         
-        # 6. Comprehensive Weather Dashboard
+        # 6. Comprehensive Weather Dashboard, drawn here while the workers handle the charts
+        dashboard = None
         if all(key in analysis_results for key in ["weather_distribution", "weather_severity_analysis",
                                                   "clear_vs_adverse", "weather_risk_factors"]):
-            filepath = self._create_weather_dashboard(
-                analysis_results,
-                timestamp
-            )
-            generated_files.append(filepath)
+            dashboard = lambda: self._create_weather_dashboard(analysis_results, timestamp)
         
+        generated_files = self._run_charts(tasks, dashboard)
+        
+        self._flush_writes()
         print(f"✓ Generated {len(generated_files)} weather visualizations")
         return generated_files
     
     def _create_weather_distribution_chart(self, weather_data: Dict[str, Dict[str, Any]], 
-                                          timestamp: str) -> str:
+                                          timestamp: str, total: Optional[int] = None) -> str:
         """Create chart for weather distribution"""
-        plt.figure(figsize=(12, 6))
+        fig = self._get_fig((12, 6))
+        ax = fig.add_subplot(111)
         
         # Extract data
-        weather_types = list(weather_data.keys())
-        counts = [data["count"] for data in weather_data.values()]
-        percentages = [data["percentage"] for data in weather_data.values()]
+        n = len(weather_data)
+        weather_types = np.array(list(weather_data.keys()))
+        counts = np.fromiter((data["count"] for data in weather_data.values()), dtype=np.int64, count=n)
+        percentages = np.fromiter((data["percentage"] for data in weather_data.values()), dtype=np.float64, count=n)
         
         # Sort by count (descending)
-        sorted_indices = np.argsort(counts)[::-1]
-        weather_types = [weather_types[i] for i in sorted_indices]
-        counts = [counts[i] for i in sorted_indices]
-        percentages = [percentages[i] for i in sorted_indices]
+        order = np.argsort(-counts, kind='stable')
+        weather_types, counts, percentages = weather_types[order], counts[order], percentages[order]
         
         # Create horizontal bar chart
         y_pos = range(len(weather_types))
-        colors = plt.cm.Blues(np.linspace(0.3, 0.9, len(weather_types)))
+        colors = _sample_cmap('Blues', len(weather_types), 0.3, 0.9)
         
-        bars = plt.barh(y_pos, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
+        bars = ax.barh(y_pos, counts, color=colors, alpha=0.7, edgecolor='navy', linewidth=1)
         
-        plt.title('Crash Distribution by Weather Condition', fontsize=14, fontweight='bold', pad=20)
-        plt.xlabel('Number of Crashes', fontsize=12)
-        plt.yticks(y_pos, weather_types)
-        plt.gca().invert_yaxis()
-        plt.grid(True, alpha=0.3, axis='x')
+        ax.set_title('Crash Distribution by Weather Condition', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xlabel('Number of Crashes', fontsize=12)
+        ax.set_yticks(y_pos, weather_types)
+        ax.invert_yaxis()
+        ax.grid(True, alpha=0.3, axis='x')
         
         # Add percentage labels
-        for i, (bar, percentage) in enumerate(zip(bars, percentages)):
-            width = bar.get_width()
-            plt.text(width + max(counts)*0.01, bar.get_y() + bar.get_height()/2.,
-                    f'{percentage:.1f}%', ha='left', va='center', fontsize=9)
+        ax.bar_label(bars, labels=[f'{percentage:.1f}%' for percentage in percentages], padding=3, fontsize=9)
         
         # Add total count
-        total = sum(counts)
-        plt.text(0.02, 0.98, f'Total Crashes: {total:,}',
-                transform=plt.gca().transAxes, fontsize=10,
+        if total is None:
+            total = int(counts.sum())
+        ax.text(0.02, 0.98, f'Total Crashes: {total:,}',
+                transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/weather/weather_distribution_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/weather_distribution_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_weather_severity_chart(self, severity_data: Dict[str, Dict[str, Any]], 
                                       timestamp: str) -> str:
         """Create chart for weather severity analysis"""
-        plt.figure(figsize=(12, 6))
-        
         # Extract data
-        weather_types = list(severity_data.keys())
-        avg_severities = [data["average_severity"] for data in severity_data.values()]
-        crash_counts = [data["crash_count"] for data in severity_data.values()]
+        n = len(severity_data)
+        weather_types = np.array(list(severity_data.keys()))
+        avg_severities = np.fromiter((data["average_severity"] for data in severity_data.values()),
+                                     dtype=np.float64, count=n)
+        crash_counts = np.fromiter((data["crash_count"] for data in severity_data.values()),
+                                   dtype=np.int64, count=n)
         
         # Sort by average severity (descending)
-        sorted_indices = np.argsort(avg_severities)[::-1]
-        weather_types = [weather_types[i] for i in sorted_indices]
-        avg_severities = [avg_severities[i] for i in sorted_indices]
-        crash_counts = [crash_counts[i] for i in sorted_indices]
+        order = np.argsort(-avg_severities, kind='stable')
+        weather_types, avg_severities, crash_counts = weather_types[order], avg_severities[order], crash_counts[order]
         
         # Create figure with two y-axes
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        fig = self._get_fig((12, 6))
+        ax1 = fig.add_subplot(111)
         
         # Bar chart for average severity
-        colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(weather_types)))
+        colors = _sample_cmap('RdYlGn_r', len(weather_types), 0.2, 0.8)
         bars = ax1.bar(weather_types, avg_severities, color=colors, alpha=0.7)
         
         ax1.set_xlabel('Weather Condition', fontsize=12)
         ax1.set_ylabel('Average Severity Score', fontsize=12, color='darkred')
         ax1.tick_params(axis='y', labelcolor='darkred')
-        plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels on bars
-        for bar, severity in zip(bars, avg_severities):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                    f'{severity:.2f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        ax1.bar_label(bars, fmt='%.2f', padding=3, fontsize=9, fontweight='bold')
         
         # Create second y-axis for crash counts
         ax2 = ax1.twinx()
@@ -755,24 +851,22 @@ class TrafficVisualizationEngine:
         ax2.set_ylabel('Number of Crashes', fontsize=12, color='darkblue')
         ax2.tick_params(axis='y', labelcolor='darkblue')
         
-        plt.title('Weather Conditions vs Injury Severity', fontsize=14, fontweight='bold', pad=20)
+        ax1.set_title('Weather Conditions vs Injury Severity', fontsize=14, fontweight='bold', pad=20)
         
         # Add legend
         ax1.legend(['Average Severity'], loc='upper left')
         ax2.legend(['Crash Count'], loc='upper right')
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/weather/weather_severity_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/weather_severity_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_clear_adverse_chart(self, clear_adverse_data: Dict[str, Any], 
                                    timestamp: str) -> str:
         """Create chart for clear vs adverse weather comparison"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig = self._get_fig((14, 6))
+        axes = fig.subplots(1, 2)
         fig.suptitle('Clear vs Adverse Weather Analysis', fontsize=16, fontweight='bold')
         
         # Subplot 1: Crash Counts
@@ -790,10 +884,7 @@ class TrafficVisualizationEngine:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
+        ax1.bar_label(bars, fmt='%d', padding=3, fontsize=12, fontweight='bold')
         
         # Subplot 2: Percentages
         ax2 = axes[1]
@@ -816,29 +907,26 @@ class TrafficVisualizationEngine:
         ax2.text(0, 0, f'Ratio: {ratio:.2f}', ha='center', va='center',
                 fontsize=11, fontweight='bold', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/weather/clear_adverse_weather_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/clear_adverse_weather_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_weather_risk_factors_chart(self, risk_data: Dict[str, Dict[str, Any]], 
                                           timestamp: str) -> str:
         """Create chart for weather risk factors"""
-        plt.figure(figsize=(12, 6))
+        fig = self._get_fig((12, 6))
+        ax = fig.add_subplot(111)
         
         # Extract and sort data by risk factor
-        weather_types = list(risk_data.keys())
-        risk_factors = [data["risk_factor"] for data in risk_data.values()]
-        risk_levels = [data["risk_level"] for data in risk_data.values()]
+        weather_types = np.array(list(risk_data.keys()))
+        risk_factors = np.fromiter((data["risk_factor"] for data in risk_data.values()),
+                                   dtype=np.float64, count=len(risk_data))
+        risk_levels = np.array([data["risk_level"] for data in risk_data.values()])
         
         # Sort by risk factor (descending)
-        sorted_indices = np.argsort(risk_factors)[::-1]
-        weather_types = [weather_types[i] for i in sorted_indices]
-        risk_factors = [risk_factors[i] for i in sorted_indices]
-        risk_levels = [risk_levels[i] for i in sorted_indices]
+        order = np.argsort(-risk_factors, kind='stable')
+        weather_types, risk_factors, risk_levels = weather_types[order], risk_factors[order], risk_levels[order]
         
         # Color by risk level
         colors = []
@@ -852,36 +940,31 @@ class TrafficVisualizationEngine:
         
         # Create bar chart
         y_pos = range(len(weather_types))
-        bars = plt.barh(y_pos, risk_factors, color=colors, alpha=0.7, edgecolor='black', linewidth=1)
+        bars = ax.barh(y_pos, risk_factors, color=colors, alpha=0.7, edgecolor='black', linewidth=1)
         
-        plt.title('Weather Condition Risk Factors', fontsize=14, fontweight='bold', pad=20)
-        plt.xlabel('Risk Factor (Relative to Clear Weather)', fontsize=12)
-        plt.yticks(y_pos, weather_types)
-        plt.gca().invert_yaxis()
-        plt.grid(True, alpha=0.3, axis='x')
+        ax.set_title('Weather Condition Risk Factors', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xlabel('Risk Factor (Relative to Clear Weather)', fontsize=12)
+        ax.set_yticks(y_pos, weather_types)
+        ax.invert_yaxis()
+        ax.grid(True, alpha=0.3, axis='x')
         
         # Add baseline (clear weather = 1.0)
-        plt.axvline(x=1.0, color='blue', linestyle='--', alpha=0.5, label='Baseline (Clear Weather)')
-        plt.legend()
+        ax.axvline(x=1.0, color='blue', linestyle='--', alpha=0.5, label='Baseline (Clear Weather)')
+        ax.legend()
         
         # Add value labels
-        for bar, risk, level in zip(bars, risk_factors, risk_levels):
-            width = bar.get_width()
-            plt.text(width + 0.05, bar.get_y() + bar.get_height()/2.,
-                    f'{risk:.2f} ({level})', ha='left', va='center', fontsize=9)
+        ax.bar_label(bars, labels=[f'{risk:.2f} ({level})' for risk, level in zip(risk_factors, risk_levels)],
+                     padding=3, fontsize=9)
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/weather/weather_risk_factors_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/weather_risk_factors_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_weather_temporal_chart(self, temporal_data: Dict[str, Dict[str, Any]], 
                                       timestamp: str) -> str:
         """Create chart for weather temporal patterns"""
-        plt.figure(figsize=(14, 8))
+        fig = self._get_fig((14, 8))
         
         # Get unique weather types with peak hour data
         weather_types = []
@@ -896,13 +979,13 @@ class TrafficVisualizationEngine:
             return ""
         
         # Create polar plot
-        ax = plt.subplot(111, projection='polar')
+        ax = fig.add_subplot(111, projection='polar')
         
         # Convert hours to radians
         theta = [hour * 2 * np.pi / 24 for hour in peak_hours]
         
         # Create colors based on weather type
-        colors = plt.cm.Set2(np.linspace(0, 1, len(weather_types)))
+        colors = _sample_cmap('Set2', len(weather_types), 0, 1)
         
         # Plot points
         scatter = ax.scatter(theta, [1] * len(theta), c=colors, s=200, alpha=0.7, edgecolors='black')
@@ -915,54 +998,49 @@ class TrafficVisualizationEngine:
         ax.set_ylim(0, 1.2)
         ax.grid(True, alpha=0.3)
         
-        plt.title('Peak Crash Hours by Weather Condition', fontsize=16, fontweight='bold', pad=20)
+        ax.set_title('Peak Crash Hours by Weather Condition', fontsize=16, fontweight='bold', pad=20)
         
         # Add legend
-        for i, weather in enumerate(weather_types):
-            ax.plot([], [], 'o', color=colors[i], label=f'{weather}: {peak_hours[i]}:00', markersize=8)
-        
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        
-        plt.tight_layout()
+        handles = [Line2D([], [], marker='o', linestyle='', color=color, markersize=8,
+                          label=f'{weather}: {hour}:00')
+                   for weather, hour, color in zip(weather_types, peak_hours, colors)]
+        ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
         
-        filename = f"{self.output_dir}/weather/weather_temporal_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/weather_temporal_{timestamp}.{self._fmt}"
+        self._save(fig, filename)
         
         return filename
     
     def _create_weather_dashboard(self, analysis_results: Dict[str, Any], 
                                  timestamp: str) -> str:
         """Create comprehensive weather analysis dashboard"""
-        fig = plt.figure(figsize=(20, 16))
-        fig.suptitle('Weather Analysis Dashboard', fontsize=18, fontweight='bold', y=0.98)
+        fig = self._get_fig((20, 16))
+        fig.suptitle('Weather Analysis Dashboard', fontsize=18, fontweight='bold')
         
         # Create grid layout
-        gs = gridspec.GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+        gs = gridspec.GridSpec(3, 3, figure=fig)
         
         # 1. Weather Distribution (top left)
         ax1 = fig.add_subplot(gs[0, 0])
         weather_data = analysis_results["weather_distribution"]
-        weather_types = list(weather_data.keys())[:6]  # Top 6
-        counts = [weather_data[w]["count"] for w in weather_types]
-        colors = plt.cm.Blues(np.linspace(0.3, 0.9, len(weather_types)))
+        weather_types, columns = _unpack(weather_data, ("count",), 6)  # Top 6
+        counts = columns["count"]
+        colors = _sample_cmap('Blues', len(weather_types), 0.3, 0.9)
         ax1.barh(weather_types, counts, color=colors)
         ax1.set_title('Top Weather Conditions', fontsize=12, fontweight='bold')
         ax1.set_xlabel('Crashes')
         ax1.invert_yaxis()
-        ax1.grid(True, alpha=0.3, axis='x')
         
         # 2. Weather Severity (top middle)
         ax2 = fig.add_subplot(gs[0, 1])
         severity_data = analysis_results["weather_severity_analysis"]
-        weather_types = list(severity_data.keys())[:5]  # Top 5
-        severities = [severity_data[w]["average_severity"] for w in weather_types]
-        colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(weather_types)))
+        weather_types, columns = _unpack(severity_data, ("average_severity",), 5)  # Top 5
+        severities = columns["average_severity"]
+        colors = _sample_cmap('RdYlGn_r', len(weather_types), 0.2, 0.8)
         ax2.bar(weather_types, severities, color=colors)
         ax2.set_title('Average Severity by Weather', fontsize=12, fontweight='bold')
         ax2.set_ylabel('Severity Score')
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
-        ax2.grid(True, alpha=0.3, axis='y')
+        setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
         # 3. Clear vs Adverse (top right)
         ax3 = fig.add_subplot(gs[0, 2])
@@ -981,41 +1059,40 @@ class TrafficVisualizationEngine:
         # 4. Risk Factors (middle left)
         ax4 = fig.add_subplot(gs[1, 0])
         risk_data = analysis_results["weather_risk_factors"]
-        weather_types = list(risk_data.keys())[:5]
-        risks = [risk_data[w]["risk_factor"] for w in weather_types]
+        weather_types, columns = _unpack(risk_data, ("risk_factor",), 5)
+        risks = columns["risk_factor"]
         colors = ['red' if r > 1.5 else 'orange' if r > 1.0 else 'green' for r in risks]
         ax4.barh(weather_types, risks, color=colors)
         ax4.set_title('Weather Risk Factors', fontsize=12, fontweight='bold')
         ax4.set_xlabel('Risk Factor')
         ax4.invert_yaxis()
         ax4.axvline(x=1.0, color='blue', linestyle='--', alpha=0.5)
-        ax4.grid(True, alpha=0.3, axis='x')
         
         # 5. Temporal Patterns (middle right, span 2 columns)
         ax5 = fig.add_subplot(gs[1, 1:])
         temporal_data = analysis_results.get("weather_temporal_patterns", {})
         
-        # Prepare heatmap data
-        weather_types = list(temporal_data.keys())[:4]
-        heatmap_data = []
-        
-        for weather in weather_types:
-            if "hourly_distribution" in temporal_data[weather]:
-                hourly_data = temporal_data[weather]["hourly_distribution"]
-                hours = list(range(24))
-                counts = [hourly_data.get(h, 0) for h in hours]
-                heatmap_data.append(counts)
-        
-        if heatmap_data:
-            im = ax5.imshow(heatmap_data, cmap='YlOrRd', aspect='auto', interpolation='nearest')
-            ax5.set_title('Hourly Patterns by Weather', fontsize=12, fontweight='bold')
+        # Prepare heatmap data: one row of 24 hourly counts per weather type
+        weather_types = [weather for weather in list(temporal_data.keys())[:4]
+                         if "hourly_distribution" in temporal_data[weather]]
+        heatmap_data = np.zeros((len(weather_types), 24))
+        
+        for row, weather in zip(heatmap_data, weather_types):
+            hourly_data = temporal_data[weather]["hourly_distribution"]
+            n = len(hourly_data)
+            row[np.fromiter(hourly_data.keys(), dtype=np.intp, count=n)] = \
+                np.fromiter(hourly_data.values(), dtype=np.float64, count=n)
+        
+        if weather_types:
+            ax5.imshow(heatmap_data, cmap='YlOrRd', aspect='auto', interpolation='nearest',
+                       rasterized=True)
+            ax5.set_title('Hourly Patterns by Weather (darker = more crashes)', fontsize=12, fontweight='bold')
             ax5.set_xlabel('Hour of Day')
             ax5.set_ylabel('Weather Condition')
             ax5.set_yticks(range(len(weather_types)))
             ax5.set_yticklabels(weather_types)
             ax5.set_xticks(range(0, 24, 3))
             ax5.set_xticklabels([f'{h}:00' for h in range(0, 24, 3)])
-            plt.colorbar(im, ax=ax5, label='Crash Count')
         
         # 6. Key Metrics Summary (bottom row, full width)
         ax6 = fig.add_subplot(gs[2, :])
@@ -1067,20 +1144,19 @@ class TrafficVisualizationEngine:
                 fontsize=11, family='monospace', verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/weather/weather_dashboard_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['weather']}/weather_dashboard_{timestamp}.{self._fmt}"
+        self._save(fig, filename, dpi=self._dashboard_dpi)
         
         return filename
     
-    def generate_comprehensive_visualizations(self, analysis_results: Dict[str, Any]) -> List[str]:
+    def generate_comprehensive_visualizations(self, analysis_results: Dict[str, Any],
+                                              timestamp: Optional[str] = None) -> List[str]:
         """
         Generate comprehensive visualizations from all analyses
         
         Args:
             analysis_results: Results from comprehensive analysis
+            timestamp: File name timestamp shared with the rest of a run, a new one if not given
             
         Returns:
             List of file paths for generated charts
@@ -1092,24 +1168,25 @@ class TrafficVisualizationEngine:
             return []
         
         generated_files = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self._new_run()
 
         # Generate executive summary dashboard
         if all(key in analysis_results for key in ["temporal_analysis", "weather_analysis"]):
             filepath = self._create_executive_summary_dashboard(analysis_results, timestamp)
             generated_files.append(filepath)
         
+        self._flush_writes()
         print(f"✓ Generated {len(generated_files)} comprehensive visualizations")
         return generated_files
     
     def _create_executive_summary_dashboard(self, analysis_results: Dict[str, Any], 
                                            timestamp: str) -> str:
         """Create executive summary dashboard"""
-        fig = plt.figure(figsize=(20, 16))
-        fig.suptitle('Traffic Safety Analysis - Executive Summary', fontsize=20, fontweight='bold', y=0.98)
+        fig = self._get_fig((20, 16))
+        fig.suptitle('Traffic Safety Analysis - Executive Summary', fontsize=20, fontweight='bold')
         
         # Create grid layout
-        gs = gridspec.GridSpec(4, 4, figure=fig, hspace=0.4, wspace=0.4)
+        gs = gridspec.GridSpec(4, 4, figure=fig)
         
         # Get data from each analysis
         temporal = analysis_results.get("temporal_analysis", {})
@@ -1243,10 +1320,7 @@ class TrafficVisualizationEngine:
                 fontsize=11, family='monospace', verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
         
-        plt.tight_layout()
-        
-        filename = f"{self.output_dir}/comprehensive/executive_summary_{timestamp}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        filename = f"{self._dirs['comprehensive']}/executive_summary_{timestamp}.{self._fmt}"
+        self._save(fig, filename, dpi=self._dashboard_dpi)
         
         return filename
@@ -1,11 +1,13 @@
 # src/analysis/export_sql_outputs.py
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 
 from src.utils.config import PostgresConfig, get_paths
-from src.storage.postgres_io import get_conn
+from src.storage.postgres_io import pooled_conn
 
 
 def export_query(conn, sql: str, output_file: Path) -> None:
@@ -13,9 +15,12 @@ def export_query(conn, sql: str, output_file: Path) -> None:
     Execute a SQL query and export the result to a CSV file.
     """
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    df = pd.read_sql_query(sql, conn)
-    df.to_csv(output_file, index=False)
-    print(f"[OK] Exported {len(df)} rows -> {output_file}")
+    # let postgres format the CSV and stream it straight into the file
+    copy_sql = f"COPY ({sql.strip().rstrip(';')}) TO STDOUT WITH (FORMAT CSV, HEADER)"
+    with open(output_file, 'wb') as f, conn.cursor() as cur:
+        cur.copy_expert(copy_sql, f)
+        rows = cur.rowcount
+    print(f"[OK] Exported {rows} rows -> {output_file}")
 
 
 def main() -> None:
@@ -23,17 +28,18 @@ def main() -> None:
     Task 8: Export SQL outputs (analysis results) to results/outputs/*.csv
     """
     cfg = PostgresConfig()
-    conn = get_conn(cfg)
-
-    # Debug: confirm we are connected to the expected database/schema
-    print("[DEBUG] Connected to:", cfg.host, cfg.port, cfg.db, cfg.user)
-    print(pd.read_sql_query("SELECT current_database() AS db, current_schema() AS schema;", conn))
-    print(pd.read_sql_query("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema='analytics' AND table_name='traffic_flow'
-        ORDER BY ordinal_position;
-    """, conn))
+    # Debug: confirm we are connected to the expected database/schema (set EXPORT_DEBUG=1)
+    if os.environ.get("EXPORT_DEBUG") == "1":
+        print("[DEBUG] Connected to:", cfg.host, cfg.port, cfg.db, cfg.user)
+        with pooled_conn(cfg) as conn:
+            print(pd.read_sql_query("""
+                SELECT
+                  current_database() AS db,
+                  current_schema() AS schema,
+                  (SELECT array_agg(column_name ORDER BY ordinal_position)
+                   FROM information_schema.columns
+                   WHERE table_schema='analytics' AND table_name='traffic_flow') AS traffic_flow_columns;
+            """, conn))
 
     paths = get_paths()
     output_dir = paths["results_outputs"]
@@ -117,10 +123,16 @@ def main() -> None:
         """,
     }
 
-    for file_name, sql in queries.items():
-        export_query(conn, sql, output_dir / file_name)
+    def export_one(item: tuple[str, str]) -> None:
+        file_name, sql = item
+        with pooled_conn(cfg) as conn:
+            export_query(conn, sql, output_dir / file_name)
+
+    # the queries are independent, so run them side by side on separate pooled connections
+    # (fewer workers than the pool's 8 connections, so getconn never runs dry)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(export_one, queries.items()))
 
-    conn.close()
     print("[DONE] All outputs exported.")
 
 # dagster pipeline to export the SQL outputs to CSV files
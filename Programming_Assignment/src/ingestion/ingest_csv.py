@@ -1,12 +1,66 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Iterator
 import pandas as pd
 
-def readcsv(file_path: Path) -> pd.DataFrame:
+# Optional: pyarrow tokenizes the CSV on all cores instead of pandas' single thread
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+def readcsv(file_path: Path, dtype: dict[str, str] | None = None) -> pd.DataFrame:
     """
     Reads a CSV file and returns a pandas DataFrame.
+    Columns named in dtype (e.g. {"site": "string"}) skip type inference.
+    """
+    if pacsv is not None:
+        # keep timestamps as text and empty cells as nulls, like pd.read_csv
+        tbl = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dtype, timestamp_parsers=[], strings_can_be_null=True
+            ),
+        )
+        df = tbl.to_pandas(self_destruct=True)
+    else:
+        df = pd.read_csv(file_path, dtype=dtype)
+    # Normalize column names (simple, safe)
+    df.columns = [c.strip() for c in df.columns]
+    return df
+
+def readcsv_chunks(
+    file_path: Path, dtype: dict[str, str] | None = None, chunksize: int = 100_000
+) -> Iterator[pd.DataFrame]:
     """
-    df = pd.read_csv(file_path)
+    Reads a CSV file as a stream of pandas DataFrames of about chunksize rows.
+    Integer columns come back as nullable Int64, so a chunk with empty cells keeps its integer type.
+    """
+    if pacsv is not None:
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dtype, timestamp_parsers=[], strings_can_be_null=True
+            ),
+        )
+        int_types = {pa.int64(): pd.Int64Dtype()}.get
+        batches, rows = [], 0
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= chunksize:
+                yield _strip_columns(pa.Table.from_batches(batches).to_pandas(types_mapper=int_types))
+                batches, rows = [], 0
+        if batches:
+            yield _strip_columns(pa.Table.from_batches(batches).to_pandas(types_mapper=int_types))
+    else:
+        for df in pd.read_csv(file_path, dtype=dtype, chunksize=chunksize, dtype_backend="numpy_nullable"):
+            yield _strip_columns(df)
+
+def _strip_columns(df: pd.DataFrame) -> pd.DataFrame:
     # Normalize column names (simple, safe)
     df.columns = [c.strip() for c in df.columns]
     return df
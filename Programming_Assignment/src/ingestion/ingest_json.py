@@ -1,32 +1,51 @@
 from __future__ import annotations
-from calendar import c
-from os import path, read
 from pathlib import Path
 import json
 import pandas as pd
 
+# Optional: orjson parses and re-encodes the JSON much faster than the stdlib module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(value) -> str:
+    # Encode a nested list/dict as a JSON string
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False)
+
 def read_json(file_path: Path) -> pd.DataFrame:
     """
     Reads a JSON file and returns a pandas DataFrame.
     """
-    read_text = path.read_text(encoding='utf-8')
-    data = json.loads(read_text)
+    raw = file_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     if isinstance(data, dict) and 'data' in data:
         data = data['data']
 
     if not isinstance(data, list):
         raise ValueError(f"Expected a list of objects, got {type(data)}")
-    
-    df = pd.json_normalize(data)
+
+    # the records are flat apart from a few object fields, so build the frame directly
+    # and only run json_normalize over the columns that actually hold dicts
+    df = pd.DataFrame.from_records(data)
+    for col in df.columns[df.dtypes == object]:
+        if any(isinstance(x, dict) for x in df[col].values):
+            nested = df[col].map(lambda x: x if isinstance(x, dict) else {})
+            flat = pd.json_normalize(nested.tolist()).add_prefix(f"{col}.")
+            # like json_normalize: the parent keeps only its non-dict values, the keys go to the end
+            df[col] = df[col].where(nested.map(len) == 0)
+            df = pd.concat([df, flat.set_axis(df.index)], axis=1)
     # Convert any list/dict columns into JSON strings (so they can be stored as TEXT safely)
-    for col in df.columns:
-        has_nested = df[col].apply(lambda x: isinstance(x, (list, dict))).any()
-        if has_nested:
-            df[col] = df[col].apply(
-                lambda x: json.dumps(x, ensure_ascii=False) if isinstance(x, (list, dict)) else x
+    # only plain object columns can hold them (not str columns); stop scanning a column at its first nested value
+    for col in df.columns[df.dtypes == object]:
+        if any(isinstance(x, (list, dict)) for x in df[col].values):
+            df[col] = df[col].map(
+                lambda x: _dumps(x) if isinstance(x, (list, dict)) else x
             )
     # wipe out any empty columns
     df.columns = [c.strip() for c in df.columns]
 
-    return df
\ No newline at end of file
+    return df
@@ -1,22 +1,57 @@
 from __future__ import annotations
-from curses import raw
-from os import read
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from numpy import append
-from pandas import read_json
-from requests import get
+import pandas as pd
 
 from src.utils.config import PostgresConfig, get_paths
-from src.ingestion.ingest_csv import readcsv
-from src.storage.postgres_io import get_conn, ensure_schema_and_table, append_rows
+from src.ingestion.ingest_csv import readcsv_chunks
+from src.ingestion.ingest_json import read_json
+from src.storage.postgres_io import get_conn, pooled_conn, ensure_schema_and_table, append_rows
+
+# known text columns of the raw CSVs, read as strings without type inference
+# (also keeps mixed id columns like "Local Case Number" from being split into ints and strs)
+CSV_TEXT_COLUMNS = {
+    "traffic_flow_sdcc_2023_h1": ["site", "day", "date", "start_time", "end_time"],
+    "crash_drivers_montgomery_md": [
+        "Report Number", "Local Case Number", "Agency Name", "ACRS Report Type", "Crash Date/Time",
+        "Route Type", "Road Name", "Cross-Street Name", "Off-Road Description", "Municipality",
+        "Related Non-Motorist", "Collision Type", "Weather", "Surface Condition", "Light",
+        "Traffic Control", "Driver Substance Abuse", "Non-Motorist Substance Abuse", "Person ID",
+        "Driver At Fault", "Injury Severity", "Circumstance", "Driver Distracted By",
+        "Drivers License State", "Vehicle ID", "Vehicle Damage Extent",
+        "Vehicle First Impact Location", "Vehicle Body Type", "Vehicle Movement",
+        "Vehicle Going Dir", "Driverless Vehicle", "Parked Vehicle", "Vehicle Make",
+        "Vehicle Model", "Location",
+    ],
+}
+
+def csv_reader(table: str):
+    # readcsv_chunks with the table's text columns pinned to strings
+    return partial(readcsv_chunks, dtype=dict.fromkeys(CSV_TEXT_COLUMNS[table], "string"))
 
 # this method will be ingest the data into the database
-def ingest_File(conn, schema: str, table: str, df):
+def ingest_File(conn, schema: str, table: str, chunks):
 
-    #  creat the schema and table if not exist
-    ensure_schema_and_table(conn, schema, table, df)
-    append_rows(conn, schema, table, df)
-    print(f"[OK]{len(df)} Data Ingested into {schema}.{table}")
+    # chunks is a DataFrame or an iterator of DataFrames (streamed CSVs)
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    rows = 0
+    for i, df in enumerate(chunks):
+        #  creat the schema and table if not exist (typed from the first chunk)
+        if i == 0:
+            ensure_schema_and_table(conn, schema, table, df)
+        append_rows(conn, schema, table, df)
+        rows += len(df)
+    print(f"[OK]{rows} Data Ingested into {schema}.{table}")
+
+def ingest_pipeline(schema: str, table: str, file_path, reader):
+    # read one raw file and load it into its staging table (runs in a worker process)
+    conn = get_conn(PostgresConfig())
+    try:
+        ingest_File(conn, schema, table, reader(file_path))
+    finally:
+        conn.close()
 
 def main():
 
@@ -28,22 +63,24 @@ def main():
     traffic_csv = raw_dir / "traffic_flow_sdcc_2023_h1.csv"
     drivers_csv = raw_dir / "crash_drivers_montgomery_md.csv"
     crashes_json = raw_dir / "crash_incidents_cary_nc.json"
-    # read the data from the csv and json files
-    traffic_df = readcsv(traffic_csv)
-    drivers_df = readcsv(drivers_csv)
-    crashes_df = read_json(crashes_json)
-
-    # connect to the database
-    cfg = PostgresConfig()
-    conn = get_conn(cfg)
 
     schema = "staging"
-    # ingest the data into the database one by one
-    ingest_File(conn, schema, "traffic_flow_sdcc_2023_h1", traffic_df)
-    ingest_File(conn, schema, "crash_drivers_montgomery_md", drivers_df)
-    ingest_File(conn, schema, "crash_incidents_cary_nc", crashes_df)
+    # create the schema up front, so the workers' "if not exists" checks don't race each other
+    with pooled_conn(PostgresConfig()) as conn:
+        with conn.cursor() as cur:
+            cur.execute(f'create schema if not exists "{schema}"')
+        conn.commit()
 
-    conn.close()
+    # read and ingest the three files side by side, one process each (parsing holds the GIL)
+    jobs = [
+        ("traffic_flow_sdcc_2023_h1", traffic_csv, csv_reader("traffic_flow_sdcc_2023_h1")),
+        ("crash_drivers_montgomery_md", drivers_csv, csv_reader("crash_drivers_montgomery_md")),
+        ("crash_incidents_cary_nc", crashes_json, read_json),
+    ]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(ingest_pipeline, schema, *job) for job in jobs]
+        for future in futures:
+            future.result()
 
 if __name__ == "__main__":
     main()
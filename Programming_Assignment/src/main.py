@@ -16,15 +16,50 @@ from utils.settings import (
     COLLECTIONS,
     DATA_FILES,
     PROCESSING_CONFIG,
-    ANALYSIS_CONFIG
+    ANALYSIS_CONFIG,
+    PERFORMANCE_CONFIG
 )
 from storage.schema_manager import SchemaManager
 from analysis.data_analysis import TrafficAnalysisEngine
 from analysis.data_visualization import TrafficVisualizationEngine
 from preprocessing.data_processor import TrafficDataProcessor
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
+
+# Optional: orjson serializes the result dicts much faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_native(obj):
+    """Copy of obj with numpy scalars/arrays turned into Python numbers/lists, for the stdlib encoder"""
+    if isinstance(obj, dict):
+        return {_to_native(key): _to_native(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_native(item) for item in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
+
+
+def _write_json(path: str, data) -> None:
+    """Write analysis results as indented JSON, via orjson when available"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(
+            data, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with open(path, "w") as f:
+            json.dump(_to_native(data), f, indent=2, default=str)
+
 
 def main():
     """Main execution function"""
@@ -41,27 +76,31 @@ def main():
         maxPoolSize=MONGODB_CONFIG["max_pool_size"]
     )
     
-    # Test connection
-    client.admin.command('ping')
-    print("✓ MongoDB connection established")
-    
-    # 2. Setup schemas
-    print("\n2. Setting up database schemas...")
+    # Test connection and set up schemas (2.) in the background, overlapping the
+    # ping round trip with the schema file reads and the processor setup below
     schema_manager = SchemaManager(client, MONGODB_CONFIG["database"])
-    
-    # Setup all schemas
-    schema_results = schema_manager.setup_all_schemas(SCHEMA_FILES)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ping_future = executor.submit(client.admin.command, 'ping')
+        schema_future = executor.submit(schema_manager.setup_all_schemas, SCHEMA_FILES)
+        
+        # 3. Initialize data processor
+        processor = TrafficDataProcessor(
+            mongo_uri=MONGODB_CONFIG["uri"],
+            db_name=MONGODB_CONFIG["database"]
+        )
+        
+        ping_future.result()
+        print("✓ MongoDB connection established")
+        
+        # 2. Setup schemas
+        print("\n2. Setting up database schemas...")
+        schema_results = schema_future.result()
     
     for schema_name, success in schema_results.items():
         status = "✓" if success else "✗"
         print(f"  {status} {schema_name}")
     
-    # 3. Initialize data processor
     print("\n3. Initializing data processor...")
-    processor = TrafficDataProcessor(
-        mongo_uri=MONGODB_CONFIG["uri"],
-        db_name=MONGODB_CONFIG["database"]
-    )
     
     # 4. Load and process data
     print("\n4. Loading and processing data...")
@@ -76,62 +115,63 @@ def main():
         
     # 2. Initialize analysis engine
     print("\n2. Initializing analysis engine...")
-    analysis_engine = TrafficAnalysisEngine(client)
+    analysis_engine = TrafficAnalysisEngine(
+        client,
+        cache_dir=PERFORMANCE_CONFIG["analysis_cache_dir"] if PERFORMANCE_CONFIG["use_cache"] else None,
+        cache_ttl=PERFORMANCE_CONFIG["cache_ttl"]
+    )
     
     # 3. Initialize visualization engine
     print("3. Initializing visualization engine...")
-    visualization_engine = TrafficVisualizationEngine()
+    visualization_engine = TrafficVisualizationEngine(dpi=ANALYSIS_CONFIG["chart_dpi"],
+                                                      fmt=ANALYSIS_CONFIG["chart_format"],
+                                                      dashboard_dpi=ANALYSIS_CONFIG["dashboard_dpi"])
     
     # 4. Perform analyses
     print("\n4. Performing data analyses...")
     
-    # Option 1: Individual analyses
-    print("\n   Running individual analyses:")
-    
-    # Temporal analysis
-    print("   - Temporal analysis...")
-    temporal_results = analysis_engine.perform_temporal_analysis(days_back=180)
-    
-    # Weather analysis
-    print("   - Weather analysis...")
-    weather_results = analysis_engine.perform_weather_analysis(days_back=180)
-    
-    # Option 2: Comprehensive analysis
-    print("\n   Running comprehensive analysis...")
-    comprehensive_results = analysis_engine.perform_comprehensive_analysis(days_back=180)
-    
-    # 5. Save analysis results
+    # Individual (temporal, weather) and comprehensive analyses run side by side;
+    # with one shared window end they all reuse the engine's single crash fetch
+    print("\n   Running temporal, weather and comprehensive analyses...")
+    end_date = datetime.now()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        temporal_future = executor.submit(analysis_engine.perform_temporal_analysis, 180, end_date)
+        weather_future = executor.submit(analysis_engine.perform_weather_analysis, 180, end_date)
+        comprehensive_future = executor.submit(analysis_engine.perform_comprehensive_analysis, 180, end_date)
+        temporal_results = temporal_future.result()
+        weather_results = weather_future.result()
+        comprehensive_results = comprehensive_future.result()
+    
+    # 5. Save analysis results, in the background while the charts render
     print("\n5. Saving analysis results...")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Save individual results
-    with open(f"reports/analysis_results_temporal_{timestamp}.json", "w") as f:
-        json.dump(temporal_results, f, indent=2, default=str)
-    
-    with open(f"reports/analysis_results_weather_{timestamp}.json", "w") as f:
-        json.dump(weather_results, f, indent=2, default=str)
-    
-    # Save comprehensive results
-    with open(f"reports/analysis_results_comprehensive_{timestamp}.json", "w") as f:
-        json.dump(comprehensive_results, f, indent=2, default=str)
-    
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        writes = [
+            writer.submit(_write_json, f"reports/analysis_results_{name}_{timestamp}.json", results)
+            for name, results in (("temporal", temporal_results),
+                                  ("weather", weather_results),
+                                  ("comprehensive", comprehensive_results))
+        ]
+        
+        # 6. Generate visualizations
+        print("\n6. Generating visualizations...")
+        
+        # One run, so every chart file shares a timestamp
+        try:
+            charts = visualization_engine.generate_all(temporal_results, weather_results, comprehensive_results)
+        finally:
+            # Finish the chart writes and stop the worker processes
+            visualization_engine.close_all()
+        temporal_charts = charts["temporal"]
+        weather_charts = charts["weather"]
+        comprehensive_charts = charts["comprehensive"]
+        
+        for write in writes:
+            write.result()
     print("✓ Analysis results saved to JSON files")
     
-    # 6. Generate visualizations
-    print("\n6. Generating visualizations...")
-    
-    # Generate visualizations for individual analyses
-    print("\n   Generating temporal visualizations...")
-    temporal_charts = visualization_engine.generate_temporal_visualizations(temporal_results)
-    
-    print("   Generating weather visualizations...")
-    weather_charts = visualization_engine.generate_weather_visualizations(weather_results)
-   
-    # Generate comprehensive visualizations
-    print("\n   Generating comprehensive visualizations...")
-    comprehensive_charts = visualization_engine.generate_comprehensive_visualizations(comprehensive_results)
-    
     # 7. Summary
     print("\n" + "="*60)
     print("ANALYSIS AND VISUALIZATION COMPLETE")
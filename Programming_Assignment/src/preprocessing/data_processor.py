@@ -5,17 +5,192 @@ Traffic Data Processor with schema validation
 import pandas as pd
 import numpy as np
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import re
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 from pymongo import MongoClient
 
+# Optional: pyarrow's multi-threaded CSV reader, pandas read_csv without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# Optional: ijson streams the incidents JSON array instead of loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from settings import DATA_FILES, PROCESSING_CONFIG, SCHEMA_FILES
 from schema_manager import SchemaManager
 
 logger = logging.getLogger(__name__)
 
+# Cleaned crash columns read by transform_crash_data
+CRASH_DOCUMENT_COLUMNS = [
+    'Report Number', 'Local Case Number', 'Agency Name', 'ACRS Report Type', 'Crash Date/Time',
+    'Route Type', 'Road Name', 'Cross-Street Name', 'Municipality',
+    'Weather', 'Surface Condition', 'Light', 'Traffic Control',
+    'Collision Type', 'Driver At Fault', 'Injury Severity',
+    'Vehicle ID', 'Vehicle Damage Extent', 'Vehicle Body Type', 'Vehicle Make',
+    'Vehicle Model', 'Vehicle Year', 'Speed Limit',
+    'Driver Substance Abuse', 'Non-Motorist Substance Abuse'
+]
+
+# Cleaned traffic flow / incidents columns read by their transform_* methods
+TRAFFIC_FLOW_DOCUMENT_COLUMNS = [
+    'site', 'day', 'date', 'start_time', 'end_time', 'duration_minutes',
+    'flow', 'flow_pc', 'cong', 'cong_pc', 'dsat', 'dsat_pc'
+]
+INCIDENT_DOCUMENT_COLUMNS = [
+    'tamainid', 'location_description', 'lon2', 'lat2',
+    'rdfeature', 'rdcharacter', 'rdclass', 'rdconfigur', 'rdsurface', 'rdcondition',
+    'lightcond', 'weather', 'trafcontrl',
+    'crash_date', 'ta_date', 'ta_time', 'fatality', 'possblinj', 'fatalities', 'injuries',
+    'vehicles_consolidated', 'year', 'month'
+]
+
+# Raw crash CSV columns the loader reads, text unless typed below
+CRASH_CSV_NUMERIC = {'Speed Limit': 'float32', 'Vehicle Year': 'float32', 'Latitude': 'float64', 'Longitude': 'float64'}
+CRASH_CSV_COLUMNS = CRASH_DOCUMENT_COLUMNS + ['Latitude', 'Longitude', 'Location']
+# Crash Date/Time stays text here, clean_crash_data parses it (bad values become NaT)
+CRASH_CSV_DTYPES = {col: CRASH_CSV_NUMERIC.get(col, str) for col in CRASH_CSV_COLUMNS}
+CRASH_DATETIME_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# Crash CSV values read as missing, on top of the readers' defaults
+CRASH_NULL_VALUES = ['', ' ', 'Unknown', 'UNKNOWN', 'unknown', 'N/A', 'null', 'NULL']
+
+# Latitude and longitude out of a crash Location string like "(39.10533874, -76.98984545)"
+_COORD_RE = re.compile(r'^\s*\(?\s*([-+]?\d+(?:\.\d+)?)\s*,\s*([-+]?\d+(?:\.\d+)?)')
+
+# Raw traffic flow CSV columns the loader reads
+TRAFFIC_FLOW_METRICS = ['flow', 'flow_pc', 'cong', 'cong_pc', 'dsat', 'dsat_pc']
+TRAFFIC_FLOW_CSV_DTYPES = {
+    'site': str, 'day': str, 'date': str, 'start_time': str, 'end_time': str,
+    **{col: 'float32' for col in TRAFFIC_FLOW_METRICS}
+}
+
+# Bytes of CSV parsed per chunk by the pyarrow reader
+CSV_BLOCK_SIZE = 8 << 20
+
+
+def _read_csv_chunks(path, dtypes: Dict[str, Any], sample_size: Optional[int] = None,
+                     null_values: Optional[List[str]] = None):
+    """
+    Yield a CSV as DataFrame chunks holding just the columns in dtypes,
+    stopping after sample_size rows if given. null_values are read as
+    missing too.
+    """
+    columns = list(dtypes)
+    
+    if pacsv is None:
+        yield from pd.read_csv(
+            path,
+            usecols=columns,
+            dtype=dtypes,
+            na_values=null_values,
+            chunksize=PROCESSING_CONFIG["chunk_size"],
+            nrows=sample_size or None
+        )
+        return
+    
+    column_types = {
+        col: pa.string() if dtype is str else pa.from_numpy_dtype(np.dtype(dtype))
+        for col, dtype in dtypes.items()
+    }
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types=column_types,
+            null_values=pacsv.ConvertOptions().null_values + (null_values or []),
+            strings_can_be_null=True
+        )
+    )
+    remaining = sample_size or None
+    for batch in reader:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+        yield batch.to_pandas()
+
+
+def _read_json_batches(path, batch_size: int, sample_size: Optional[int] = None):
+    """
+    Yield the objects of a JSON array file in lists of up to batch_size,
+    stopping after sample_size objects if given.
+    
+    With ijson the array is parsed incrementally, so only one batch is
+    held at a time; without it the file is loaded with json.
+    """
+    with open(path, 'rb') as f:
+        items = ijson.items(f, 'item', use_float=True) if ijson is not None else json.load(f)
+        items = islice(items, sample_size or None)
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def _to_records(df: pd.DataFrame, columns: List[str]) -> List[Dict[str, Any]]:
+    """
+    Rows of the given columns (those present) as plain dicts
+    
+    With pyarrow the dicts are built from the Arrow columns in C++,
+    and missing values come out as None instead of NaN/NaT.
+    """
+    columns = [col for col in columns if col in df.columns]
+    if pa is not None:
+        try:
+            return pa.Table.from_pandas(df[columns], preserve_index=False).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns Arrow can't type, use pandas
+            pass
+    return df[columns].to_dict('records')
+
+
+def _has_values(df: pd.DataFrame, *columns: str) -> List[bool]:
+    """Per row, whether all of columns have a value (all False if a column is absent)"""
+    if any(col not in df.columns for col in columns):
+        return [False] * len(df)
+    return df[list(columns)].notna().all(axis=1).tolist()
+
+
+def _column_values(df: pd.DataFrame, column: str, as_int: bool = False) -> List[Any]:
+    """Per row, a column's value or None where missing (all None if the column is absent)"""
+    if column not in df.columns:
+        return [None] * len(df)
+    values = df[column]
+    if as_int:
+        # Float columns holding NaN come back as Python ints, not floats
+        values = values.astype('Int64')
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def _upper_categorical(series: pd.Series) -> pd.Series:
+    """
+    Uppercase a text column with missing values as 'UNKNOWN', as a category
+    
+    Only the distinct values are converted, the rows just get new codes.
+    """
+    codes, uniques = pd.factorize(series)
+    labels = pd.Index(uniques).astype(str).str.upper()
+    categories = labels.append(pd.Index(['UNKNOWN'])).unique()
+    # Missing values have code -1, which picks the trailing 'UNKNOWN' entry
+    label_codes = np.append(categories.get_indexer(labels), categories.get_loc('UNKNOWN'))
+    return pd.Series(pd.Categorical.from_codes(label_codes[codes], categories), index=series.index)
+
+
 class TrafficDataProcessor:
     """Processes traffic and crash data with schema validation"""
     
@@ -43,6 +218,27 @@ class TrafficDataProcessor:
         except Exception as e:
             logger.error(f"Failed to clear collection {collection_name}: {e}")
 
+    def _insert_batches(self, collection, documents: Iterable[Dict[str, Any]], batch_size: int) -> int:
+        """
+        Insert documents in unordered batches of batch_size, returns how many were sent
+        
+        documents may be a generator, only one batch of it is held at a time
+        (insert_many itself would build the whole list before sending).
+        """
+        documents = iter(documents)
+        inserted = 0
+        while True:
+            batch = list(islice(documents, batch_size))
+            if not batch:
+                return inserted
+            collection.insert_many(
+                batch,
+                ordered=False,
+                # The collection validators are skipped unless validation is enabled
+                bypass_document_validation=not PROCESSING_CONFIG["enable_validation"]
+            )
+            inserted += len(batch)
+
     def load_all_data(self, sample_size: Optional[int] = None, batch_size: int = 1000):
         """Load all data sources with schema validation"""
         return 
@@ -50,44 +246,35 @@ class TrafficDataProcessor:
         # 0. Clear existing data
         self.clear_collections()
 
-        # 1. Load crash data
+        # 1-3. Load crash, traffic flow and incidents data side by side;
+        # the three are independent and mostly wait on disk and MongoDB
+        # (the shared client is thread-safe and pools its connections)
         print("\n" + "="*50)
-        print("PROCESSING CRASH REPORTING DATA")
+        print("PROCESSING CRASH, TRAFFIC FLOW AND INCIDENTS DATA")
         print("="*50)
 
-        self._load_crash_data(sample_size)
-        
-        # 2. Load traffic flow data
-        print("\n" + "="*50)
-        print("PROCESSING TRAFFIC FLOW DATA")
-        print("="*50)
-        
-        self._load_traffic_flow_data(sample_size)
-        
-        # 3. Load incidents data
-        print("\n" + "="*50)
-        print("PROCESSING INCIDENTS DATA")
-        print("="*50)
-        
-        self._load_incidents_data(sample_size)
+        loaders = [self._load_crash_data, self._load_traffic_flow_data, self._load_incidents_data]
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(loader, sample_size, batch_size) for loader in loaders]
+            for future in futures:
+                future.result()
     
-    def _load_crash_data(self, sample_size: Optional[int] = None):
+    def _load_crash_data(self, sample_size: Optional[int] = None, batch_size: int = 1000):
         """Load and process crash reporting data"""
         try:
-            # Read CSV
-            df = pd.read_csv(DATA_FILES["crash_reports"], low_memory=False)
-            
-            # Sample if specified
-            if sample_size and sample_size < len(df):
-                df = df.head(sample_size)
-            
-            # Clean and transform
-            cleaned_df = self.clean_crash_data(df)
-            documents = self.transform_crash_data(cleaned_df)
-            
-            # Insert to db
-            self.db.crash_reports.insert_many(documents)            
-            print(f"✓ Crash reports: {len(documents)} documents inserted")
+            # Read, clean and transform one chunk at a time into one document
+            # stream, inserted in full batches (only the first sample_size rows if specified)
+            chunks = _read_csv_chunks(
+                DATA_FILES["crash_reports"],
+                CRASH_CSV_DTYPES,
+                sample_size,
+                null_values=CRASH_NULL_VALUES
+            )
+            documents = chain.from_iterable(
+                self.transform_crash_data(self.clean_crash_data(df)) for df in chunks
+            )
+            inserted = self._insert_batches(self.db.crash_reports, documents, batch_size)
+            print(f"✓ Crash reports: {inserted} documents inserted")
         except Exception as e:
             logger.error(f"Failed to load crash data: {e}")
     
@@ -96,15 +283,14 @@ class TrafficDataProcessor:
         print(f"Original crash data shape: {df.shape}")
         
         # Make a copy
+        # (missing-value sentinels are already nulled by the CSV reader)
         df = df.copy()
-        
-        # Handle missing values
-        df = df.replace(['', ' ', 'Unknown', 'UNKNOWN', 'unknown', None, 'N/A', 'null', 'NULL'], np.nan)
+        present = set(df.columns)
         
         # Parse date time
         df['Crash Date/Time'] = pd.to_datetime(
             df['Crash Date/Time'], 
-            format='%m/%d/%Y %I:%M:%S %p',
+            format=CRASH_DATETIME_FORMAT,
             errors='coerce'
         )
         
@@ -114,78 +300,70 @@ class TrafficDataProcessor:
         df['crash_hour'] = df['Crash Date/Time'].dt.hour
         df['crash_weekday'] = df['Crash Date/Time'].dt.day_name()
         
-        # Parse coordinates - handle different formats
-        def extract_coordinates(row):
-            """Extract coordinates from various possible sources in the row"""
-            sources = []
-            
-            # Source 1: Latitude and Longitude columns
-            try:
-                lat = row.get('Latitude')
-                lon = row.get('Longitude')
-                if pd.notna(lat) and pd.notna(lon):
-                    sources.append([float(lon), float(lat)])
-            except:
-                pass
-            
-            # Source 2: Location column (string format)
-            loc = row.get('Location')
-            if pd.notna(loc):
-                loc_str = str(loc)
-                # Try to extract coordinates from string like "(39.10533874, -76.98984545)"
-                try:
-                    # Remove parentheses and split
-                    clean_str = loc_str.strip('() ')
-                    parts = clean_str.split(',')
-                    if len(parts) >= 2:
-                        lat = float(parts[0].strip())
-                        lon = float(parts[1].strip())
-                        sources.append([lon, lat])
-                except:
-                    # Try regex
-                    try:
-                        coords = re.findall(r"[-+]?\d+\.\d+", loc_str)
-                        if len(coords) >= 2:
-                            sources.append([float(coords[1]), float(coords[0])])
-                    except:
-                        pass
-            
-            # Return first valid source or None
-            return sources[0] if sources else None
-        
-        # Apply coordinate extraction
-        coordinates = []
-        for idx, row in df.iterrows():
-            coords = extract_coordinates(row)
-            coordinates.append(coords)
-        
-        df['coordinates'] = coordinates
+        # Parse coordinates, Latitude/Longitude columns first, else the
+        # Location string like "(39.10533874, -76.98984545)"
+        missing = pd.Series(np.nan, index=df.index)
+        lat = pd.to_numeric(df['Latitude'], errors='coerce') if 'Latitude' in present else missing
+        lon = pd.to_numeric(df['Longitude'], errors='coerce') if 'Longitude' in present else missing
+        if 'Location' in present:
+            extracted = df['Location'].astype('string').str.extract(_COORD_RE)
+            loc_lat = pd.to_numeric(extracted[0], errors='coerce')
+            loc_lon = pd.to_numeric(extracted[1], errors='coerce')
+            use_loc = (lat.isna() | lon.isna()) & loc_lat.notna() & loc_lon.notna()
+            lat = lat.where(~use_loc, loc_lat)
+            lon = lon.where(~use_loc, loc_lon)
+        
+        # Kept as two float columns, NaN where a row has no valid pair;
+        # transform_crash_data turns them into GeoJSON points
+        valid = lat.notna() & lon.notna()
+        df['coordinates_lon'] = lon.where(valid).astype(float)
+        df['coordinates_lat'] = lat.where(valid).astype(float)
         
         # Clean numeric columns
-        if 'Speed Limit' in df.columns:
+        if 'Speed Limit' in present:
             df['Speed Limit'] = pd.to_numeric(df['Speed Limit'], errors='coerce')
         
-        if 'Vehicle Year' in df.columns:
+        if 'Vehicle Year' in present:
             df['Vehicle Year'] = pd.to_numeric(df['Vehicle Year'], errors='coerce')
         
         # Clean categorical columns
         categorical_cols = ['Weather', 'Surface Condition', 'Light', 'Traffic Control']
         for col in categorical_cols:
-            if col in df.columns:
-                df[col] = df[col].fillna('UNKNOWN').astype(str).str.upper()
+            if col in present:
+                df[col] = _upper_categorical(df[col])
         
         print(f"Cleaned crash data shape: {df.shape}")
-        print(f"Rows with coordinates: {sum(1 for x in df['coordinates'] if x is not None)}")
+        print(f"Rows with coordinates: {int(valid.sum())}")
         
         return df
 
     def transform_crash_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Transform crash data to match schema"""
-        documents = []
+        # Plain dicts of just the needed columns, no Series per row
+        records = _to_records(df, CRASH_DOCUMENT_COLUMNS)
+        has_vehicle = _has_values(df, 'Vehicle ID')
+        has_location = _has_values(df, 'coordinates_lon', 'coordinates_lat')
+        if 'coordinates_lon' in df.columns and 'coordinates_lat' in df.columns:
+            # [lon, lat] per row from one contiguous Nx2 array
+            points = np.column_stack([df['coordinates_lon'].to_numpy(), df['coordinates_lat'].to_numpy()]).tolist()
+        else:
+            points = [None] * len(df)
+        # Date parts from clean_crash_data, stored so queries can group on them directly
+        temporal = [
+            {'year': year, 'month': month, 'hour': hour, 'weekday': weekday}
+            for year, month, hour, weekday in zip(
+                _column_values(df, 'crash_year', as_int=True),
+                _column_values(df, 'crash_month', as_int=True),
+                _column_values(df, 'crash_hour', as_int=True),
+                _column_values(df, 'crash_weekday')
+            )
+        ]
+        # One ingest timestamp for the whole batch
+        now = datetime.now()
         
-        for _, row in df.iterrows():
-            # Build document according to schema
-            doc = {
+        # Build documents according to schema
+        return [
+            {
                 'report_number': row.get('Report Number'),
                 'local_case_number': row.get('Local Case Number'),
                 'agency_name': row.get('Agency Name'),
@@ -216,41 +394,38 @@ class TrafficDataProcessor:
                     'vehicle_model': row.get('Vehicle Model'),
                     'vehicle_year': row.get('Vehicle Year'),
                     'speed_limit': row.get('Speed Limit')
-                }] if pd.notna(row.get('Vehicle ID')) else [],
+                }] if vehicle else [],
                 'substance_abuse': {
                     'driver_substance_abuse': row.get('Driver Substance Abuse'),
                     'non_motorist_substance_abuse': row.get('Non-Motorist Substance Abuse')
                 },
                 'location': {
                     'type': 'Point',
-                    'coordinates': row.get('coordinates')
-                } if row.get('coordinates') else None,
+                    'coordinates': point
+                } if located else None,
+                'temporal_features': temporal_features,
                 'metadata': {
-                    'created_date': datetime.now(),
-                    'last_updated': datetime.now(),
+                    'created_date': now,
+                    'last_updated': now,
                     'data_source': 'Crash_Reporting_Drivers_Data.csv'
                 }
             }
-            documents.append(doc)
-        
-        return documents
+            for row, vehicle, point, located, temporal_features in zip(
+                records, has_vehicle, points, has_location, temporal
+            )
+        ]
 
-    def _load_traffic_flow_data(self, sample_size: Optional[int] = None):
+    def _load_traffic_flow_data(self, sample_size: Optional[int] = None, batch_size: int = 1000):
         """Load and process traffic_flow reporting data"""
         try:
-            # Read CSV
-            df = pd.read_csv(DATA_FILES["traffic_flow"], low_memory=False)
-            
-            # Sample if specified
-            if sample_size and sample_size < len(df):
-                df = df.head(sample_size)
-            
-            # Clean and transform
-            cleaned_df = self.clean_traffic_flow_data(df)
-            documents = self.transform_traffic_flow_data(cleaned_df)
-            # Insert to db
-            self.db.traffic_flow_reports.insert_many(documents)            
-            print(f"✓ Traffic_flow reports: {len(documents)} documents inserted")
+            # Read, clean and transform one chunk at a time into one document
+            # stream, inserted in full batches (only the first sample_size rows if specified)
+            chunks = _read_csv_chunks(DATA_FILES["traffic_flow"], TRAFFIC_FLOW_CSV_DTYPES, sample_size)
+            documents = chain.from_iterable(
+                self.transform_traffic_flow_data(self.clean_traffic_flow_data(df)) for df in chunks
+            )
+            inserted = self._insert_batches(self.db.traffic_flow_reports, documents, batch_size)
+            print(f"✓ Traffic_flow reports: {inserted} documents inserted")
         except Exception as e:
             logger.error(f"Failed to load traffic_flow data: {e}")
                         
@@ -260,60 +435,40 @@ class TrafficDataProcessor:
         
         # Clean column names
         df.columns = [col.strip().lower() for col in df.columns]
+        present = set(df.columns)
         
-        # Parse date
-        def parse_date(date_val):
-            if pd.isna(date_val):
-                return pd.NaT
-            date_str = str(date_val)
-            for fmt in ('%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y/%m/%d'):
-                try:
-                    return pd.to_datetime(date_str, format=fmt)
-                except:
-                    continue
-            return pd.NaT
-        
-        df['date'] = df['date'].apply(parse_date)
+        # Parse date, the first format that matches wins (one vectorized pass per format)
+        date_str = df['date'].astype('string')
+        parsed = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        for fmt in ('%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y/%m/%d'):
+            parsed = parsed.fillna(pd.to_datetime(date_str, format=fmt, errors='coerce'))
+        df['date'] = parsed
         
         # Parse start_time
         df['start_time'] = pd.to_datetime(df['start_time'], errors='coerce')
         
-        # Parse end_time (might be just time like "09:45")
-        def parse_end_time(row):
-            start = row.get('start_time')
-            end_str = row.get('end_time')
-            
-            if pd.isna(start) or pd.isna(end_str):
-                return pd.NaT
-            
-            try:
-                end_str = str(end_str)
-                # If it's just time (HH:MM)
-                if ':' in end_str and len(end_str.split(':')) == 2:
-                    time_parts = end_str.split(':')
-                    if len(time_parts) == 2:
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1])
-                        return datetime.combine(
-                            start.date(), 
-                            datetime.min.time().replace(hour=hour, minute=minute)
-                        )
-            except:
-                pass
-            
-            # Try default parsing
-            return pd.to_datetime(end_str, errors='coerce')
-        
-        df['end_time'] = df.apply(parse_end_time, axis=1)
-        
-        # Fill missing end times
-        mask = df['end_time'].isna() & df['start_time'].notna()
-        df.loc[mask, 'end_time'] = df.loc[mask, 'start_time'] + timedelta(minutes=15)
+        # Parse end_time (might be just time like "09:45", taken on the start date).
+        # Kept as naive UTC, which is how MongoDB stores datetimes anyway
+        start = df['start_time']
+        if start.dt.tz is not None:
+            start = start.dt.tz_convert(None)
+        end_str = df['end_time'].astype('string')
+        hour_minute = end_str.str.extract(r'^\s*(\d+)\s*:\s*(\d+)\s*$').astype(float)
+        is_time = hour_minute[0].between(0, 23) & hour_minute[1].between(0, 59)
+        end_time = start.dt.normalize() + pd.to_timedelta(hour_minute[0] * 60 + hour_minute[1], unit='m')
+        
+        # Anything else is parsed as a full datetime
+        other = ~is_time & end_str.notna() & start.notna()
+        if other.any():
+            end_time[other] = pd.to_datetime(
+                end_str[other], errors='coerce', format='mixed', utc=True
+            ).dt.tz_convert(None)
+        # Missing end times default to 15 minutes after the start
+        df['end_time'] = end_time.where(is_time | other).fillna(start + pd.Timedelta(minutes=15))
         
         # Clean numeric columns
-        numeric_cols = ['flow', 'flow_pc', 'cong', 'cong_pc', 'dsat', 'dsat_pc']
-        for col in numeric_cols:
-            if col in df.columns:
+        for col in TRAFFIC_FLOW_METRICS:
+            if col in present:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         
         # Extract hour
@@ -324,10 +479,12 @@ class TrafficDataProcessor:
 
     def transform_traffic_flow_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Transform crash data to match schema"""
-        documents = []
-
-        for _, row in df.iterrows():
-            doc = {
+        records = _to_records(df, TRAFFIC_FLOW_DOCUMENT_COLUMNS)
+        # One processing timestamp for the whole batch
+        now = datetime.now()
+        
+        return [
+            {
                 'site': row.get('site'),
                 'date': row.get('date'),
                 'day_of_week': row.get('day'),
@@ -346,30 +503,23 @@ class TrafficDataProcessor:
                 },
                 'metadata': {
                     'data_source': 'Traffic_Flow_Data_Jan_to_June_2023_SDCC.csv',
-                    'processing_date': datetime.now()
+                    'processing_date': now
                 }
             }
-            documents.append(doc)        
-
-        return documents
+            for row in records
+        ]
 
-    def _load_incidents_data(self, sample_size: Optional[int] = None):
+    def _load_incidents_data(self, sample_size: Optional[int] = None, batch_size: int = 1000):
         """Load and process incidents reporting data"""
         try:
-            # Read CSV
-            with open(DATA_FILES["incidents"], 'r') as f:
-                df = json.load(f)
-            
-            # Sample if specified
-            if sample_size and sample_size < len(df):
-                df = df.head(sample_size)
-            
-            # Clean and transform
-            cleaned_df = self.clean_incidents_data(df)
-            documents = self.transform_incidents_data(cleaned_df)
-            # Insert to db
-            self.db.incidents_reports.insert_many(documents)            
-            print(f"✓ Incidents reports: {len(documents)} documents inserted")
+            # Read, clean and transform one batch of objects at a time into one
+            # document stream (only the first sample_size objects if specified)
+            batches = _read_json_batches(DATA_FILES["incidents"], batch_size, sample_size)
+            documents = chain.from_iterable(
+                self.transform_incidents_data(self.clean_incidents_data(data_list)) for data_list in batches
+            )
+            inserted = self._insert_batches(self.db.incidents_reports, documents, batch_size)
+            print(f"✓ Incidents reports: {inserted} documents inserted")
         except Exception as e:
             logger.error(f"Failed to load incidents data: {e}")
                     
@@ -377,41 +527,43 @@ class TrafficDataProcessor:
         """Clean and transform incidents JSON data"""
         df = pd.DataFrame(data_list)
         print(f"Original incidents shape: {df.shape}")
+        present = set(df.columns)
         
         # Clean coordinates
-        if 'lon2' in df.columns:
+        if 'lon2' in present:
             df['longitude'] = pd.to_numeric(df['lon2'], errors='coerce')
-        if 'lat2' in df.columns:
+        if 'lat2' in present:
             df['latitude'] = pd.to_numeric(df['lat2'], errors='coerce')
         
         # Parse dates
         date_cols = ['crash_date', 'ta_date']
         for col in date_cols:
-            if col in df.columns:
+            if col in present:
                 df[col] = pd.to_datetime(df[col], errors='coerce')
         
         # Clean categorical columns
         cat_cols = ['weather', 'lightcond', 'trafcontrl']
         for col in cat_cols:
-            if col in df.columns:
-                df[col] = df[col].fillna('UNKNOWN').astype(str).str.upper()
+            if col in present:
+                df[col] = _upper_categorical(df[col])
         
         print(f"Cleaned incidents shape: {df.shape}")
         return df
     
     def transform_incidents_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Transform crash data to match schema"""
-        documents = []     
-
-        for _, row in df.iterrows():
-            doc = {
+        records = _to_records(df, INCIDENT_DOCUMENT_COLUMNS)
+        has_coordinates = _has_values(df, 'lon2', 'lat2')
+        
+        return [
+            {
                 'tamainid': row.get('tamainid'),
                 'location': {
                     'description': row.get('location_description'),
                     'coordinates': {
                         'longitude': row.get('lon2'),
                         'latitude': row.get('lat2')
-                    } if pd.notna(row.get('lon2')) and pd.notna(row.get('lat2')) else None
+                    } if coordinates else None
                 },
                 'road_characteristics': {
                     'features': row.get('rdfeature'),
@@ -439,9 +591,8 @@ class TrafficDataProcessor:
                 'year': row.get('year'),
                 'month': row.get('month')
             }
-            documents.append(doc)
-                       
-        return documents
+            for row, coordinates in zip(records, has_coordinates)
+        ]
             
     def _print_loading_summary(self, results: Dict[str, Dict[str, Any]]):
         """Print loading summary"""
@@ -1,6 +1,10 @@
 from __future__ import annotations
+import atexit
+import io
+import threading
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import pandas as pd
 from src.utils.config import PostgresConfig
 
@@ -15,12 +19,84 @@ def get_conn(cfg: PostgresConfig):
         password=cfg.password
     )
 
+# one lazily created pool per config, shared by ingestion, exports and the dagster assets
+_pools: dict[PostgresConfig, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(cfg: PostgresConfig, minconn: int = 2, maxconn: int = 8) -> ThreadedConnectionPool:
+    # Create the connection pool for cfg on first use
+    with _pools_lock:
+        pool = _pools.get(cfg)
+        if pool is None:
+            pool = _pools[cfg] = ThreadedConnectionPool(
+                minconn, maxconn,
+                host=cfg.host,
+                port=cfg.port,
+                database=cfg.db,
+                user=cfg.user,
+                password=cfg.password
+            )
+        return pool
+
+@contextmanager
+def pooled_conn(cfg: PostgresConfig):
+    # Borrow a connection from the pool and hand it back (rolled back if left mid-transaction)
+    pool = get_pool(cfg)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+@atexit.register
+def close_pools():
+    # Close every pooled connection
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+def _pg_type(dtype) -> str:
+    # Map a pandas dtype to the staging column type (anything non-numeric/non-datetime stays TEXT)
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "BIGINT"
+    if pd.api.types.is_float_dtype(dtype):
+        return "DOUBLE PRECISION"
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return "TIMESTAMPTZ"
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+def _legacy_text_columns(conn, shcema: str, table: str, df: pd.DataFrame) -> list[str]:
+    # columns an existing table still stores as TEXT although the frame now types them
+    with conn.cursor() as cur:
+        cur.execute(
+            "select column_name, data_type from information_schema.columns "
+            "where table_schema = %s and table_name = %s",
+            (shcema, table)
+        )
+        existing = dict(cur.fetchall())
+    return [c for c, t in df.dtypes.items() if existing.get(c) == "text" and _pg_type(t) != "TEXT"]
+
 def ensure_schema_and_table(conn, shcema: str, table: str, df: pd.DataFrame):
     # Create the schema if it doesn't exist
-    cols_sql = ",\n".join([f'"{c}" TEXT' for c in df.columns])
+    # typed columns spare the analytics views a text cast on every row
+    cols_sql = ",\n".join([f'"{c}" {_pg_type(t)}' for c, t in df.dtypes.items()])
+
+    # tables from before typed staging (all TEXT) would break the analytics views, so rebuild them;
+    # cascade drops the views on top, create_analytics_views recreates them after ingestion
+    drop_sql = ""
+    stale = _legacy_text_columns(conn, shcema, table, df)
+    if stale:
+        print(f"[MIGRATE] {shcema}.{table} stores {stale} as TEXT, recreating it with typed columns")
+        drop_sql = f'drop table "{shcema}".{table} cascade;'
 
     ddl = f'''
     create schema if not exists "{shcema}";
+    {drop_sql}
     create table if not exists "{shcema}".{table} (
         __ingested_at timestamptz default now(),
         {cols_sql}
@@ -31,21 +107,21 @@ def ensure_schema_and_table(conn, shcema: str, table: str, df: pd.DataFrame):
         cur.execute(ddl)
 
     conn.commit()
-def append_rows(conn, shcema: str, table: str, df: pd.DataFrame, batch_size: int = 2000):
+def append_rows(conn, shcema: str, table: str, df: pd.DataFrame, batch_size: int = 100_000):
     # append the rows to the table
 
     if df.empty:
         return
     
-    cols = list(df.columns)
-    # convert from pandas to psycopg2 format
-    values = df.astype(str).where(df.notna(), None).values.tolist()
-
-    cols_Sql = ",".join([f'"{c}"' for c in cols])
-    insert_Sql = f'insert into "{shcema}"."{table}"({cols_Sql}) values %s'
+    cols_Sql = ",".join([f'"{c}"' for c in df.columns])
+    # stream the rows as CSV through COPY, so postgres parses them in one pass
+    copy_Sql = f'copy "{shcema}"."{table}"({cols_Sql}) from stdin with (format csv, null \'\\N\')'
 
     with conn.cursor() as cur:
-        for i in range(0, len(values), batch_size):
-            chunk = values[i:i+batch_size]
-            execute_values(cur, insert_Sql, chunk)
+        # write the frame in chunks to keep the CSV buffer bounded
+        for i in range(0, len(df), batch_size):
+            buf = io.StringIO()
+            df.iloc[i:i+batch_size].to_csv(buf, index=False, header=False, na_rep='\\N')
+            buf.seek(0)
+            cur.copy_expert(copy_Sql, buf)
     conn.commit()
\ No newline at end of file
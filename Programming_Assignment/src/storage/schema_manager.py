@@ -4,8 +4,8 @@ Schema manager for MongoDB collections
 
 import json
 from pathlib import Path
-from typing import Dict, Any, List
-from pymongo import MongoClient
+from typing import Dict, Any, List, Optional, Set
+from pymongo import IndexModel, MongoClient
 from pymongo.errors import CollectionInvalid, OperationFailure
 from datetime import datetime
 import logging
@@ -34,8 +34,9 @@ class SchemaManager:
             logger.error(f"Invalid JSON in schema file {schema_file}: {e}")
             raise
     
-    def create_collection_with_schema(self, schema: Dict[str, Any]) -> bool:
-        """Create collection with schema validation"""
+    def create_collection_with_schema(self, schema: Dict[str, Any],
+                                      existing: Optional[Set[str]] = None) -> bool:
+        """Create collection with schema validation (existing: known collection names, if already fetched)"""
         collection_name = schema.get("collection")
         
         if not collection_name:
@@ -44,7 +45,9 @@ class SchemaManager:
         
         try:
             # Check if collection exists
-            if collection_name in self.db.list_collection_names():
+            if existing is None:
+                existing = set(self.db.list_collection_names())
+            if collection_name in existing:
                 logger.info(f"Collection {collection_name} already exists, updating schema")
                 
                 # Update existing collection schema
@@ -70,8 +73,9 @@ class SchemaManager:
                     collection_name,
                     validator=validator,
                     validationLevel=validation_level,
-                    validationAction=validationAction
+                    validationAction=validation_action
                 )
+                existing.add(collection_name)
                 
                 logger.info(f"Created collection {collection_name} with schema")
             
@@ -95,21 +99,25 @@ class SchemaManager:
         
         collection = self.db[collection_name]
         
+        # Send all indexes in a single createIndexes command (one round trip, one build pass)
+        try:
+            collection.create_indexes([
+                IndexModel(self._index_fields(index_def), **index_def.get("options", {}))
+                for index_def in indexes
+            ])
+            logger.info(f"Created {len(indexes)}/{len(indexes)} indexes for {collection_name}")
+            return True
+        except Exception as e:
+            logger.warning(f"Bulk index creation failed for {collection_name}, retrying one by one: {e}")
+        
         success_count = 0
         for index_def in indexes:
             try:
                 index_name = index_def.get("name", "unnamed_index")
-                fields = index_def.get("fields", [])
                 options = index_def.get("options", {})
                 
-                # Convert fields list to proper format for create_index
-                index_fields = []
-                for field in fields:
-                    for field_name, direction in field.items():
-                        index_fields.append((field_name, direction))
-                
                 # Create index
-                collection.create_index(index_fields, **options)
+                collection.create_index(self._index_fields(index_def), **options)
                 logger.info(f"Created index {index_name} for {collection_name}")
                 success_count += 1
                 
@@ -119,6 +127,15 @@ class SchemaManager:
         logger.info(f"Created {success_count}/{len(indexes)} indexes for {collection_name}")
         return success_count == len(indexes)
     
+    @staticmethod
+    def _index_fields(index_def: Dict[str, Any]) -> List[tuple]:
+        """Convert an index definition's fields list to (field, direction) pairs"""
+        index_fields = []
+        for field in index_def.get("fields", []):
+            for field_name, direction in field.items():
+                index_fields.append((field_name, direction))
+        return index_fields
+    
     def validate_document(self, collection_name: str, document: Dict[str, Any]) -> bool:
         """Validate document against collection schema"""
         try:
@@ -148,6 +165,8 @@ class SchemaManager:
     def setup_all_schemas(self, schema_files: Dict[str, Path]) -> Dict[str, bool]:
         """Setup all schemas from files"""
         results = {}
+        # List the collections once for all schemas rather than once per schema
+        existing = set(self.db.list_collection_names())
         
         for schema_name, schema_file in schema_files.items():
             try:
@@ -157,7 +176,7 @@ class SchemaManager:
                 schema = self.load_schema(schema_file)
                 
                 # Create collection with schema
-                schema_result = self.create_collection_with_schema(schema)
+                schema_result = self.create_collection_with_schema(schema, existing)
                 
                 # Create indexes
                 if schema_result:
@@ -62,8 +62,9 @@ PROCESSING_CONFIG = {
 # Analysis settings
 ANALYSIS_CONFIG = {
     "enable_charts": True,
-    "chart_format": "png",
+    "chart_format": os.getenv("VIZ_FMT", "png"),
     "chart_dpi": 150,
+    "dashboard_dpi": 100,
     "save_analytics": True,
     "generate_report": True,
     "report_format": "html",
@@ -129,5 +130,6 @@ PERFORMANCE_CONFIG = {
     "use_cache": True,
     "cache_ttl": 3600,  # 1 hour
     "query_timeout": 30000,  # 30 seconds
-    "max_documents_per_query": 100000
+    "max_documents_per_query": 100000,
+    "analysis_cache_dir": BASE_DIR / "data/processed/analysis_cache"  # Parquet cache of past months
 }
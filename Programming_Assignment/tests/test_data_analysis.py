@@ -0,0 +1,37 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Make src importable, like main.py does
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+mongomock = pytest.importorskip("mongomock")
+pytest.importorskip("pyarrow")
+
+from analysis.data_analysis import TrafficAnalysisEngine
+
+
+def test_month_cache_with_empty_first_month(tmp_path):
+    # Crashes only in the last 90 days of a 180 day window, so the first cached month is empty
+    client = mongomock.MongoClient()
+    end_date = datetime(2026, 10, 15, 12)
+    client["traffic_safety_db"].crash_reports.insert_many([
+        {
+            "crash_datetime": end_date - timedelta(days=day),
+            "collision_details": {"injury_severity": "Fatal Injury"},
+            "environmental_conditions": {"weather": ["Clear", "Rain"][day % 2]},
+        }
+        for day in range(90)
+    ])
+
+    cached = TrafficAnalysisEngine(client, cache_dir=tmp_path, cache_ttl=3600)
+    live = TrafficAnalysisEngine(client)
+
+    temporal = cached.perform_temporal_analysis(180, end_date=end_date)
+    assert "error" not in temporal
+    assert temporal["hourly_distribution"] == live.perform_temporal_analysis(180, end_date=end_date)["hourly_distribution"]
+
+    weather = cached.perform_weather_analysis(180, end_date=end_date)
+    assert weather == live.perform_weather_analysis(180, end_date=end_date)